@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Synthetic large-report benchmark for validate_report.py
+
+Generates reports with N bibliography entries (each cited in the body),
+validates them, and prints wall time per report and per entry. With linear
+scaling the per-entry time stays flat as N grows; the script exits non-zero
+if it grows by more than --max-growth between the smallest and largest size.
+
+Usage:
+    python bench_validate_report.py
+    python bench_validate_report.py --sizes 1000 5000 20000 50000 --naive
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from validate_report import ReportValidator
+
+SECTIONS = [
+    "Executive Summary", "Introduction", "Main Analysis", "Synthesis",
+    "Limitations", "Recommendations", "Counterevidence Register",
+    "Claims-Evidence Table", "Methodology",
+]
+
+
+def generate_report(path: Path, entries: int, per_paragraph: int = 5):
+    """Write a structurally valid report citing every one of `entries` sources"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("# Synthetic Benchmark Report\n\n")
+        cited = 1
+        for name in SECTIONS:
+            f.write(f"## {name}\n\n")
+            share = entries // len(SECTIONS) + 1
+            stop = min(entries + 1, cited + share)
+            while cited < stop:
+                markers = ' '.join(f"[{n}]" for n in range(cited, min(stop, cited + per_paragraph)))
+                f.write(f"Findings on topic {cited} are supported by several studies {markers}. "
+                        f"The evidence base is consistent across independent analyses.\n\n")
+                cited += per_paragraph
+            f.write("Summary paragraph with enough words to look like real prose. " * 10 + "\n\n")
+        f.write("## Bibliography\n\n")
+        for n in range(1, entries + 1):
+            f.write(f'[{n}] Author{n}, A. ({2000 + n % 24}). "Study number {n} of things". '
+                    f'Journal {n % 50}. https://doi.org/10.1234/bench.{n}\n')
+
+
+def naive_gap_check(bib_nums: List[int]) -> List[int]:
+    """The list-membership gap check validate_report.py used to run"""
+    expected = list(range(1, bib_nums[-1] + 1))
+    return [n for n in expected if n not in bib_nums]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validate_report.py on large synthetic reports")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000],
+                        help='Bibliography sizes to generate (default: 1000 5000 20000)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per size; the fastest is reported (default: 3)')
+    parser.add_argument('--max-growth', type=float, default=3.0,
+                        help='Allowed growth of per-entry time from smallest to largest size (default: 3.0)')
+    parser.add_argument('--naive', action='store_true',
+                        help='Also time the old quadratic gap check for comparison')
+    args = parser.parse_args()
+
+    sizes = sorted(args.sizes)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = Path(tmp) / f"bench_{size}.md"
+            generate_report(path, size)
+
+            best = float('inf')
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                validator = ReportValidator(path)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    validator.validate()
+                best = min(best, time.perf_counter() - started)
+            if validator.errors:
+                print(f"❌ Synthetic report with {size} entries failed validation: {validator.errors}")
+                sys.exit(1)
+
+            naive = None
+            if args.naive:
+                started = time.perf_counter()
+                naive_gap_check(list(range(1, size + 1)))
+                naive = time.perf_counter() - started
+
+            rows.append((size, path.stat().st_size, best, naive))
+
+    print(f"{'entries':>8}  {'size':>9}  {'validate':>10}  {'per entry':>10}  {'naive gaps':>10}")
+    for size, nbytes, secs, naive in rows:
+        naive_col = f"{naive * 1000:.0f}ms" if naive is not None else '-'
+        print(f"{size:>8}  {nbytes / 1024:>7.0f}KB  {secs * 1000:>8.0f}ms  "
+              f"{secs / size * 1e6:>8.1f}µs  {naive_col:>10}")
+
+    first, last = rows[0], rows[-1]
+    growth = (last[2] / last[0]) / (first[2] / first[0])
+    print(f"\nPer-entry time growth {first[0]} → {last[0]} entries: {growth:.2f}x")
+    if growth > args.max_growth:
+        print(f"❌ Validation does not scale linearly (growth > {args.max_growth}x)")
+        sys.exit(1)
+    print("✅ Validation time scales linearly with bibliography size")
+
+
+if __name__ == '__main__':
+    main()
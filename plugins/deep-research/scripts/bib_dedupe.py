@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate bibliography detection (MinHash + LSH)
+
+Large reports sometimes cite the same work two or three times under slightly
+different titles or URLs. Comparing all pairs is quadratic, so instead:
+
+1. Exact keys: entries sharing a normalized DOI or normalized URL (host,
+   full path and non-tracking query). URLs are only compared exactly:
+   different deep pages of one site share most of their tokens
+2. MinHash signatures of each entry's title words, split into LSH bands;
+   only entries that share a band bucket become candidates
+3. Candidates are confirmed with exact Jaccard similarity and merged into
+   clusters with union-find
+
+Total work is roughly linear in the number of entries. Buckets with more
+than MAX_BUCKET entries are skipped, with a note on stderr.
+"""
+
+import hashlib
+import random
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from citation_cache import normalize_doi
+
+NUM_PERM = 32
+BANDS = 8  # 8 bands x 4 rows: pairs above ~0.6 Jaccard almost always collide
+ROWS = NUM_PERM // BANDS
+TITLE_THRESHOLD = 0.7
+MAX_BUCKET = 200  # ignore degenerate buckets instead of going quadratic
+
+_rng = random.Random(0x5EED)
+_MASKS = [_rng.getrandbits(64) for _ in range(NUM_PERM)]
+
+# Function words shared by unrelated titles; they only add spurious candidates
+STOPWORDS = {
+    'a', 'an', 'the', 'of', 'on', 'in', 'for', 'and', 'or', 'to', 'with', 'by',
+    'from', 'at', 'as', 'is', 'are', 'via', 'towards', 'toward',
+}
+
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|ref|ref_src|fbclid|gclid|source)$', re.IGNORECASE)
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form for comparing URLs (scheme, www, tracking params, fragment)"""
+    parts = urlsplit(url.strip().rstrip('.,;'))
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    path = parts.path.rstrip('/')
+    # arXiv PDF and abstract pages are the same work
+    if host == 'arxiv.org':
+        path = re.sub(r'^/pdf/(.+?)(?:\.pdf)?$', r'/abs/\1', path)
+        path = re.sub(r'v\d+$', '', path)
+    query = urlencode(sorted((k, v) for k, v in parse_qsl(parts.query)
+                             if not TRACKING_PARAMS.match(k)))
+    return f"{host}{path}" + (f"?{query}" if query else '')
+
+
+def title_tokens(title: str) -> Set[str]:
+    words = re.sub(r'[^\w\s]', ' ', title.lower()).split()
+    return {w for w in words if w not in STOPWORDS}
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def minhash(tokens: Iterable[str]) -> Tuple[int, ...]:
+    """NUM_PERM-value MinHash signature (XOR-mask hash family)"""
+    hashes = [_token_hash(t) for t in tokens]
+    return tuple(min(h ^ mask for h in hashes) for mask in _MASKS)
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class DuplicateCluster:
+    """Entries that look like the same work"""
+    nums: List[str]
+    reasons: List[str] = field(default_factory=list)
+
+    def suggestion(self) -> str:
+        keep, *merge = self.nums
+        merged = ', '.join(f'[{n}]' for n in merge)
+        return f"keep [{keep}], merge {merged} ({'; '.join(self.reasons)})"
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+def _lsh_candidates(signatures: Dict[int, Tuple[int, ...]]) -> Set[Tuple[int, int]]:
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+    for i, sig in signatures.items():
+        for band in range(BANDS):
+            buckets[(band, sig[band * ROWS:(band + 1) * ROWS])].append(i)
+
+    pairs = set()
+    skipped = set()
+    for members in buckets.values():
+        if len(members) > MAX_BUCKET:
+            skipped.update(members)
+        elif len(members) > 1:
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    pairs.add((members[a], members[b]))
+    if skipped:
+        print(f"Note: near-duplicate check skipped oversized title buckets covering "
+              f"{len(skipped)} entries; duplicates among them may be unreported", file=sys.stderr)
+    return pairs
+
+
+def find_duplicates(entries: List[Dict]) -> List[DuplicateCluster]:
+    """Cluster near-duplicate bibliography entries (see module docstring)"""
+    uf = _UnionFind(len(entries))
+    reasons: Dict[Tuple[int, int], str] = {}
+
+    def link(i: int, j: int, reason: str):
+        i, j = min(i, j), max(i, j)
+        reasons.setdefault((i, j), reason)
+        uf.union(i, j)
+
+    # 1. Exact DOI / URL keys
+    exact: Dict[str, int] = {}
+    for i, entry in enumerate(entries):
+        keys = []
+        if entry.get('doi'):
+            keys.append('doi:' + normalize_doi(entry['doi']))
+        if entry.get('url'):
+            keys.append('url:' + normalize_url(entry['url']))
+        for key in keys:
+            if key in exact:
+                link(exact[key], i, 'same DOI' if key.startswith('doi:') else 'same URL')
+            else:
+                exact[key] = i
+
+    # 2./3. MinHash + LSH on titles, confirmed by exact Jaccard
+    titles = {i: title_tokens(e['title']) for i, e in enumerate(entries) if e.get('title')}
+    signatures = {i: minhash(t) for i, t in titles.items() if t}
+    for i, j in _lsh_candidates(signatures):
+        similarity = jaccard(titles[i], titles[j])
+        if similarity >= TITLE_THRESHOLD:
+            link(i, j, f'title similarity {similarity:.0%}')
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for i in range(len(entries)):
+        groups[uf.find(i)].append(i)
+    group_reasons: Dict[int, Set[str]] = defaultdict(set)
+    for (i, _), reason in reasons.items():
+        group_reasons[uf.find(i)].add(reason)
+
+    return [
+        DuplicateCluster([entries[i]['num'] for i in members], sorted(group_reasons[root]))
+        for root, members in groups.items() if len(members) > 1
+    ]
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Streaming bibliography extraction
+
+Archived merged reports can be hundreds of MB. Instead of reading the file
+into a string and running a DOTALL regex over it, MappedReport memory-maps
+the file, locates the Bibliography / 参考文献 heading with a bytes regex on
+the map, and decodes only one line at a time. iter_bibliography() yields
+parsed entries lazily, so memory stays bounded by the largest entry.
+
+Section boundaries match the original regex
+    ##\\s+(?:Bibliography|参考文献)(.*?)(?=##|\\Z)
+i.e. the section body runs from the heading to the next "##" (or EOF).
+"""
+
+import mmap
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+BIB_HEADING = re.compile(
+    rb'##\s+(?:Bibliography|' + '参考文献'.encode('utf-8') + rb')',
+    re.IGNORECASE
+)
+ENTRY_START = re.compile(r'^\[(\d+)\]\s+(.+)$')
+
+
+class MappedReport:
+    """
+    Read-only memory map of a report file (usable as a context manager).
+
+    in_memory reads the file into bytes instead: for files that may be
+    truncated or rewritten while in use (watch mode), where touching a
+    mapped page past the new end of file would raise SIGBUS.
+    """
+
+    def __init__(self, path: Path, in_memory: bool = False):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        if in_memory:
+            self.data = self._file.read()
+            return
+        try:
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self.data = b''
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MappedReport':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def bibliography_span(self) -> Optional[Tuple[int, int, int]]:
+        """(heading_start, body_start, body_end) byte offsets, or None if missing"""
+        match = BIB_HEADING.search(self.data)
+        if not match:
+            return None
+        end = self.data.find(b'##', match.end())
+        return match.start(), match.end(), (len(self.data) if end == -1 else end)
+
+    def iter_line_spans(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """Decode [start, end) one line at a time, with each line's byte offset"""
+        end = len(self.data) if end is None else end
+        pos = start
+        while pos < end:
+            nl = self.data.find(b'\n', pos, end)
+            stop = end if nl == -1 else nl
+            yield pos, self.data[pos:stop].decode('utf-8', errors='replace')
+            pos = stop + 1
+
+    def iter_lines(self, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+        """Decode [start, end) one line at a time"""
+        for _, line in self.iter_line_spans(start, end):
+            yield line
+
+    def iter_bibliography_lines(self) -> Iterator[str]:
+        span = self.bibliography_span()
+        if span:
+            yield from self.iter_lines(span[1], span[2])
+
+
+def _new_entry(num: str, rest: str) -> Dict:
+    # Try to parse: Author (Year). "Title". Venue. URL
+    year_match = re.search(r'\((\d{4})\)', rest)
+    title_match = re.search(r'"([^"]+)"', rest)
+    doi_match = re.search(r'doi\.org/(10\.\S+)', rest)
+    url_match = re.search(r'https?://[^\s\)]+', rest)
+
+    return {
+        'num': num,
+        'raw': rest,
+        'year': year_match.group(1) if year_match else None,
+        'title': title_match.group(1) if title_match else None,
+        'doi': doi_match.group(1) if doi_match else None,
+        'url': url_match.group(0) if url_match else None
+    }
+
+
+def parse_entries(lines: Iterable[str]) -> Iterator[Dict]:
+    """Group bibliography lines into entries: [N] Author (Year). "Title". Venue. URL"""
+    current_entry = None
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        match_num = ENTRY_START.match(line)
+        if match_num:
+            if current_entry:
+                yield current_entry
+            current_entry = _new_entry(match_num.group(1), match_num.group(2))
+        elif current_entry:
+            # Multi-line entry, append to raw
+            current_entry['raw'] += ' ' + line
+
+    if current_entry:
+        yield current_entry
+
+
+def iter_bibliography(path: Path) -> Iterator[Dict]:
+    """Lazily yield parsed bibliography entries of the report at path"""
+    with MappedReport(path) as report:
+        yield from parse_entries(report.iter_bibliography_lines())
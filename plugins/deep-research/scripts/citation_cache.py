@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Persistent caches for citation verification
+
+Stores DOI metadata lookups and URL liveness checks in a small sqlite
+database under ~/.claude/research_output so repeated verification runs
+(and different reports citing the same papers) do not hit the network again.
+
+DOI lookups: successes and 404s are cached with separate TTLs; transient
+failures (timeouts, 5xx) are never cached.
+
+URL checks: live URLs keep their ETag/Last-Modified so stale entries can be
+revalidated with a conditional request; failures are cached negatively with
+an expiry that doubles on every consecutive failure.
+
+Per-report verdicts: ResultsSidecar keeps each entry's verification result
+next to the report, keyed by a hash of the entry text, so re-running after an
+edit only re-verifies new or changed entries. Stored verdicts expire after
+DEFAULT_RESULTS_TTL, so a URL that has since died is checked again.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_CACHE_PATH = Path.home() / '.claude' / 'research_output' / 'citation_cache.sqlite'
+
+DAY = 24 * 60 * 60
+DEFAULT_DOI_TTL = 30 * DAY
+DEFAULT_DOI_NEGATIVE_TTL = 1 * DAY
+DEFAULT_URL_TTL = 7 * DAY
+URL_NEGATIVE_BASE_TTL = 60 * 60
+URL_NEGATIVE_MAX_TTL = 7 * DAY
+DEFAULT_RESULTS_TTL = 7 * DAY
+
+
+def normalize_doi(doi: str) -> str:
+    """Normalize DOI for use as a cache key (DOIs are case-insensitive)"""
+    doi = doi.strip()
+    doi = re.sub(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', '', doi, flags=re.IGNORECASE)
+    doi = doi.rstrip('.,;)]')
+    return doi.lower()
+
+
+class DOICache:
+    """sqlite-backed DOI metadata cache, safe to share between threads"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH,
+                 ttl: float = DEFAULT_DOI_TTL,
+                 negative_ttl: float = DEFAULT_DOI_NEGATIVE_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS doi_cache ('
+            ' doi TEXT PRIMARY KEY,'
+            ' found INTEGER NOT NULL,'
+            ' metadata TEXT NOT NULL,'
+            ' checked_at REAL NOT NULL)'
+        )
+        self._conn.commit()
+
+    def get(self, doi: str) -> Optional[Tuple[bool, Dict]]:
+        """Return cached (found, metadata) or None if missing/expired"""
+        key = normalize_doi(doi)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT found, metadata, checked_at FROM doi_cache WHERE doi = ?', (key,)
+            ).fetchone()
+
+            if row:
+                found, metadata, checked_at = row
+                ttl = self.ttl if found else self.negative_ttl
+                if time.time() - checked_at < ttl:
+                    self.hits += 1
+                    return bool(found), json.loads(metadata)
+
+            self.misses += 1
+            return None
+
+    def put(self, doi: str, found: bool, metadata: Dict):
+        """Store a successful lookup or a definitive not-found result"""
+        key = normalize_doi(doi)
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO doi_cache (doi, found, metadata, checked_at) '
+                'VALUES (?, ?, ?, ?)',
+                (key, int(found), json.dumps(metadata, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class URLCache:
+    """sqlite-backed URL liveness cache, safe to share between threads"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_URL_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS url_cache ('
+            ' url TEXT PRIMARY KEY,'
+            ' ok INTEGER NOT NULL,'
+            ' status INTEGER,'
+            ' message TEXT NOT NULL,'
+            ' final_url TEXT,'
+            ' etag TEXT,'
+            ' last_modified TEXT,'
+            ' failures INTEGER NOT NULL DEFAULT 0,'
+            ' checked_at REAL NOT NULL)'
+        )
+        self._conn.commit()
+
+    def _expiry(self, ok: bool, failures: int) -> float:
+        if ok:
+            return self.ttl
+        return min(URL_NEGATIVE_BASE_TTL * 2 ** max(failures - 1, 0), URL_NEGATIVE_MAX_TTL)
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Return the cached record for url, or None if never checked.
+        record['fresh'] tells whether it can be used without a network request.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT ok, status, message, final_url, etag, last_modified, failures, checked_at '
+                'FROM url_cache WHERE url = ?', (url,)
+            ).fetchone()
+
+            if not row:
+                self.misses += 1
+                return None
+
+            ok, status, message, final_url, etag, last_modified, failures, checked_at = row
+            fresh = time.time() - checked_at < self._expiry(bool(ok), failures)
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return {
+            'ok': bool(ok),
+            'status': status,
+            'message': message,
+            'final_url': final_url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'failures': failures,
+            'checked_at': checked_at,
+            'fresh': fresh,
+        }
+
+    def put(self, url: str, ok: bool, message: str, status: Optional[int] = None,
+            final_url: Optional[str] = None, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        """Record a check result; consecutive failures lengthen the negative expiry"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT failures FROM url_cache WHERE url = ?', (url,)
+            ).fetchone()
+            failures = 0 if ok else (row[0] if row else 0) + 1
+            self._conn.execute(
+                'INSERT OR REPLACE INTO url_cache '
+                '(url, ok, status, message, final_url, etag, last_modified, failures, checked_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, int(ok), status, message, final_url, etag, last_modified,
+                 failures, time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, url: str):
+        """Mark a cached entry as freshly revalidated (HTTP 304)"""
+        with self._lock:
+            self._conn.execute(
+                'UPDATE url_cache SET checked_at = ? WHERE url = ?', (time.time(), url)
+            )
+            self._conn.commit()
+            self.revalidated += 1
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Bump when verification logic changes so stored verdicts are not reused
+RESULTS_VERSION = 1
+
+# Verdicts worth reusing; 'unverified'/'unknown' mean we could not check
+REUSABLE_STATUSES = {'verified', 'url_verified', 'suspicious'}
+
+
+def entry_hash(entry: Dict) -> str:
+    """Content hash of a bibliography entry's normalized raw text"""
+    raw = ' '.join(entry.get('raw', '').split())
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class ResultsSidecar:
+    """
+    JSON file of stored verdicts for one report (<report>.citations.json).
+    fingerprint identifies the hallucination rule set; verdicts produced
+    under different rules are not reused. Verdicts older than ttl are not
+    reused either; reusing a verdict does not renew it.
+    """
+
+    def __init__(self, report_path: Path, fingerprint: str = '', ttl: float = DEFAULT_RESULTS_TTL):
+        self.path = report_path.with_name(report_path.stem + '.citations.json')
+        self.fingerprint = fingerprint
+        self.ttl = ttl
+
+    def load(self) -> Dict[str, Dict]:
+        """Return reusable verdicts keyed by entry hash"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != RESULTS_VERSION or data.get('rules') != self.fingerprint:
+            return {}
+        now = time.time()
+        return {
+            key: result for key, result in data.get('entries', {}).items()
+            if result.get('status') in REUSABLE_STATUSES
+            and now - result.get('checked_at', 0) < self.ttl
+        }
+
+    def save(self, entries: List[Dict], results: List[Dict]):
+        """Store verdicts for the current entries (drops removed entries)"""
+        now = time.time()
+        stored = {}
+        for entry, result in zip(entries, results):
+            # Reused verdicts keep the time they were actually checked
+            stored[entry_hash(entry)] = dict({k: v for k, v in result.items() if k != 'log'},
+                                             checked_at=result.get('checked_at', now))
+        data = {'version': RESULTS_VERSION, 'rules': self.fingerprint, 'entries': stored}
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        tmp_path.replace(self.path)
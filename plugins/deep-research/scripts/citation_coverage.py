@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Citation density and coverage per section
+
+analyze() maps every citation marker of a ReportIndex (report_index.py) to
+its section and paragraph. Sections, paragraphs and markers are all stored
+in document order, so one forward walk over them is enough, with no search
+per marker. For each section it reports:
+
+- citations and distinct sources cited, and citations per 1,000 words
+- paragraphs, and the line spans of paragraphs without any citation
+
+and for the whole report the order in which each source is first cited.
+The bibliography section itself is left out, and so is anything before
+the first "##" heading (title and metadata).
+"""
+
+import csv
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from report_index import ReportIndex
+
+CSV_FIELDS = ['report', 'section', 'level', 'line', 'words', 'citations', 'sources',
+              'density_per_1k_words', 'paragraphs', 'uncited_paragraphs', 'uncited_lines']
+
+
+@dataclass
+class SectionCoverage:
+    title: str
+    level: int
+    line: int  # heading line
+    words: int
+    citations: int = 0
+    sources: List[str] = field(default_factory=list)  # in first-use order
+    paragraphs: int = 0
+    uncited: List[Tuple[int, int]] = field(default_factory=list)  # (first_line, last_line)
+
+    @property
+    def density(self) -> float:
+        """Citations per 1,000 words"""
+        return round(self.citations * 1000 / self.words, 2) if self.words else 0.0
+
+
+@dataclass
+class FirstUse:
+    num: str
+    line: int
+    column: int
+    section: str  # '' before the first section
+
+
+@dataclass
+class CitationCoverage:
+    sections: List[SectionCoverage]
+    first_use: List[FirstUse]
+
+    def to_dict(self) -> Dict:
+        return {
+            'sections': [{
+                'title': s.title, 'level': s.level, 'line': s.line, 'words': s.words,
+                'citations': s.citations, 'sources': s.sources, 'density_per_1k_words': s.density,
+                'paragraphs': s.paragraphs,
+                'uncited_paragraphs': [{'first_line': a, 'last_line': b} for a, b in s.uncited],
+            } for s in self.sections],
+            'first_use': [{'num': int(u.num), 'line': u.line, 'column': u.column,
+                           'section': u.section} for u in self.first_use],
+        }
+
+    def csv_rows(self, report: str) -> List[Dict]:
+        """One row per section, for write_csv()"""
+        return [{
+            'report': report, 'section': s.title, 'level': s.level, 'line': s.line,
+            'words': s.words, 'citations': s.citations, 'sources': len(s.sources),
+            'density_per_1k_words': s.density, 'paragraphs': s.paragraphs,
+            'uncited_paragraphs': len(s.uncited),
+            'uncited_lines': ';'.join(f"{a}-{b}" if a != b else str(a) for a, b in s.uncited),
+        } for s in self.sections]
+
+
+class _Cursor:
+    """Finds the span holding each of a series of increasing offsets, walking the spans once"""
+
+    def __init__(self, spans: List, start: Callable, end: Callable):
+        self.spans, self.start, self.end = spans, start, end
+        self.i = 0
+
+    def at(self, offset: int) -> Optional[int]:
+        while self.i < len(self.spans) and self.end(self.spans[self.i]) <= offset:
+            self.i += 1
+        if self.i < len(self.spans) and self.start(self.spans[self.i]) <= offset:
+            return self.i
+        return None
+
+
+def analyze(index: ReportIndex) -> CitationCoverage:
+    """Per-section citation density and coverage of an indexed report"""
+    sections = [s for s in index.sections if s is not index.bibliography]
+    coverage = [SectionCoverage(s.heading.title, s.heading.level, s.heading.line, s.words)
+                for s in sections]
+    bibliography = index.bibliography
+
+    section_at = _Cursor(sections, lambda s: s.heading.offset, lambda s: s.end)
+    paragraph_at = _Cursor(index.paragraphs, lambda p: p.start, lambda p: p.end)
+    first_use: Dict[str, FirstUse] = {}
+    seen = [set() for _ in sections]
+    cited = set()
+    for marker in index.markers:
+        if bibliography and bibliography.heading.offset <= marker.offset < bibliography.end:
+            continue
+        i = section_at.at(marker.offset)
+        if marker.num not in first_use:
+            title = sections[i].heading.title if i is not None else ''
+            first_use[marker.num] = FirstUse(marker.num, marker.line, marker.column, title)
+        if i is not None:
+            coverage[i].citations += 1
+            if marker.num not in seen[i]:
+                seen[i].add(marker.num)
+                coverage[i].sources.append(marker.num)
+        p = paragraph_at.at(marker.offset)
+        if p is not None:
+            cited.add(p)
+
+    section_at = _Cursor(sections, lambda s: s.heading.offset, lambda s: s.end)
+    for p, paragraph in enumerate(index.paragraphs):
+        i = section_at.at(paragraph.start)
+        if i is None:
+            continue
+        coverage[i].paragraphs += 1
+        if p not in cited:
+            coverage[i].uncited.append((paragraph.first_line, paragraph.last_line))
+
+    return CitationCoverage(coverage, list(first_use.values()))
+
+
+def write_csv(path: Path, rows: Iterable[Dict]):
+    """Write section rows (CitationCoverage.csv_rows) of one or more reports"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
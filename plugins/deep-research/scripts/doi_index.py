@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Offline DOI Index
+
+Builds a compact sqlite index (DOI primary key, WITHOUT ROWID) from a local
+CSL-JSON or Crossref-style JSONL metadata dump, so verify_citations.py can
+check DOIs on hosts without outbound network access.
+
+The dump is streamed line by line (plain or .gz) and inserted in batches, so
+building never holds the dump in memory. Lookups are a single primary-key
+B-tree probe, well under a millisecond even with tens of millions of DOIs.
+
+Usage:
+    python doi_index.py build --dump crossref.jsonl.gz --index dois.sqlite
+    python doi_index.py lookup --index dois.sqlite 10.1038/nature14539
+"""
+
+import argparse
+import gzip
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from citation_cache import normalize_doi
+
+BATCH_SIZE = 10000
+
+
+def _first(value):
+    """Crossref dumps wrap title/container-title in lists; CSL uses strings"""
+    if isinstance(value, list):
+        return value[0] if value else ''
+    return value or ''
+
+
+def csl_to_metadata(data: Dict) -> Dict:
+    """Reduce a CSL-JSON / Crossref record to the fields verification compares"""
+    date_parts = (data.get('issued') or {}).get('date-parts') or [[None]]
+    return {
+        'title': _first(data.get('title', '')),
+        'year': date_parts[0][0] if date_parts[0] else None,
+        'authors': [
+            f"{a.get('family', '')} {a.get('given', '')}"
+            for a in data.get('author') or [] if isinstance(a, dict)
+        ],
+        'venue': _first(data.get('container-title', ''))
+    }
+
+
+def _iter_dump(dump_path: Path) -> Iterator[Tuple[str, Dict]]:
+    """Yield (normalized DOI, metadata) for each record of a JSONL dump"""
+    opener = gzip.open if dump_path.suffix == '.gz' else open
+    with opener(dump_path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            # Skip malformed records rather than abort the whole build
+            try:
+                data = json.loads(line)
+                if not isinstance(data, dict):
+                    continue
+                doi = data.get('DOI') or data.get('doi')
+                if not isinstance(doi, str) or not doi:
+                    continue
+                record = normalize_doi(doi), csl_to_metadata(data)
+            except (ValueError, TypeError, AttributeError, KeyError, IndexError):
+                continue
+            yield record
+
+
+def build_index(dump_path: Path, index_path: Path) -> int:
+    """Stream dump_path into a fresh sqlite index; returns record count"""
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    if index_path.exists():
+        index_path.unlink()
+
+    conn = sqlite3.connect(str(index_path))
+    conn.execute('PRAGMA journal_mode = OFF')
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.execute(
+        'CREATE TABLE dois ('
+        ' doi TEXT PRIMARY KEY,'
+        ' title TEXT,'
+        ' year INTEGER,'
+        ' authors TEXT,'
+        ' venue TEXT'
+        ') WITHOUT ROWID'
+    )
+
+    count = 0
+    batch = []
+    for doi, meta in _iter_dump(dump_path):
+        batch.append((doi, meta['title'], meta['year'],
+                      json.dumps(meta['authors'], ensure_ascii=False), meta['venue']))
+        if len(batch) >= BATCH_SIZE:
+            conn.executemany('INSERT OR REPLACE INTO dois VALUES (?, ?, ?, ?, ?)', batch)
+            count += len(batch)
+            batch.clear()
+    if batch:
+        conn.executemany('INSERT OR REPLACE INTO dois VALUES (?, ?, ?, ?, ?)', batch)
+        count += len(batch)
+
+    conn.commit()
+    conn.close()
+    return count
+
+
+class DOIIndex:
+    """Read-only DOI lookups against an index built by build_index"""
+
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        self._lock = threading.Lock()
+        # as_uri() percent-encodes '?' and '#' in the path
+        self._conn = sqlite3.connect(f"{self.index_path.resolve().as_uri()}?mode=ro", uri=True,
+                                     check_same_thread=False)
+
+    def lookup(self, doi: str) -> Optional[Dict]:
+        """Return metadata for doi, or None if it is not in the index"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT title, year, authors, venue FROM dois WHERE doi = ?',
+                (normalize_doi(doi),)
+            ).fetchone()
+        if not row:
+            return None
+        title, year, authors, venue = row
+        return {
+            'title': title,
+            'year': year,
+            'authors': json.loads(authors) if authors else [],
+            'venue': venue
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build or query an offline DOI metadata index",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python doi_index.py build --dump crossref.jsonl.gz --index dois.sqlite
+  python doi_index.py lookup --index dois.sqlite 10.1038/nature14539
+  python verify_citations.py --report report.md --offline-index dois.sqlite
+        """
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help='Build index from a JSONL dump')
+    build.add_argument('--dump', required=True, help='CSL-JSON / Crossref JSONL dump (.gz ok)')
+    build.add_argument('--index', required=True, help='Output sqlite index path')
+
+    lookup = subparsers.add_parser('lookup', help='Look up DOIs in an index')
+    lookup.add_argument('--index', required=True, help='sqlite index path')
+    lookup.add_argument('dois', nargs='+', help='DOIs to look up')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        dump_path = Path(args.dump)
+        if not dump_path.exists():
+            print(f"ERROR: Dump file not found: {dump_path}")
+            sys.exit(1)
+        start = time.time()
+        count = build_index(dump_path, Path(args.index))
+        print(f"Indexed {count:,} DOIs into {args.index} in {time.time() - start:.1f}s")
+    else:
+        index = DOIIndex(Path(args.index))
+        for doi in args.dois:
+            meta = index.lookup(doi)
+            print(json.dumps({'doi': doi, 'metadata': meta}, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
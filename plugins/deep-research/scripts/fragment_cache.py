@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of rendered report sections for md_to_html.py
+
+Progressive report assembly re-runs md_to_html after every section, and a
+full render of a long report costs far more than the one section that
+changed. split_sections() cuts the main content into its "##" sections,
+and FragmentCache stores the rendered HTML of each one in a small sqlite
+database keyed by a hash of the section markdown and the renderer
+identity, so a rebuild only renders sections it has not seen before.
+
+Sections render exactly as they do in the full document, because the
+split points are chosen conservatively. A split point is a "##" heading
+with the following properties:
+
+- It follows a blank line, since a table absorbs a heading line right
+  under it.
+- It is not inside a fenced code block or an HTML comment.
+- It does not come right after a raw HTML block. Python-Markdown ends a
+  raw HTML block with an extra newline, and that newline would be lost at
+  the end of a section.
+
+Reference-style link definitions apply to the whole document, so content
+that contains one is kept in a single piece.
+
+Every edited version of a section gets its own entry. Each write drops
+entries rendered more than MAX_AGE ago, and the oldest ones once there
+are more than MAX_FRAGMENTS.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+DEFAULT_FRAGMENT_CACHE_PATH = Path.home() / '.claude' / 'research_output' / 'html_fragments.sqlite'
+
+FENCE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+REFERENCE_DEFINITION = re.compile(r'^ {0,3}\[[^\[\]]*\]:', re.MULTILINE)
+
+DAY = 24 * 60 * 60
+MAX_AGE = 30 * DAY
+MAX_FRAGMENTS = 20000
+
+# sqlite's limit on query parameters is 999 in older builds
+_QUERY_BATCH = 500
+
+
+def split_sections(md_text: str) -> List[str]:
+    """Split markdown at its "##" section headings; "\\n".join() restores it"""
+    if REFERENCE_DEFINITION.search(md_text):
+        return [md_text]
+    lines = md_text.split('\n')
+    sections = []
+    start = 0
+    fence = None
+    in_comment = False
+    last_block = ''  # last non-blank line before this one
+    for i, line in enumerate(lines):
+        if i and lines[i - 1].strip():
+            last_block = lines[i - 1].strip()
+        if fence:
+            if line.rstrip() == fence:
+                fence = None
+            continue
+        # Fences are found before HTML blocks, even inside a comment
+        m = FENCE.match(line)
+        if in_comment:
+            in_comment = '-->' not in line
+        elif (line.startswith('##') and line[2:3].isspace() and i > start
+              and not lines[i - 1].strip() and not last_block.endswith('>')):
+            sections.append('\n'.join(lines[start:i]))
+            start = i
+        if m:
+            fence = m.group(1)
+        elif '<!--' in line and not in_comment:
+            in_comment = '-->' not in line[line.index('<!--'):]
+    sections.append('\n'.join(lines[start:]))
+    return sections
+
+
+def fragment_key(section_md: str, renderer: str, mode: str = '') -> str:
+    """sha256 of a section's markdown, the renderer identity and the render mode"""
+    digest = hashlib.sha256(f'{renderer}\0{mode}\0'.encode('utf-8'))
+    digest.update(section_md.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class FragmentCache:
+    """sqlite-backed rendered sections, safe to share between threads and processes"""
+
+    def __init__(self, path: Path = DEFAULT_FRAGMENT_CACHE_PATH,
+                 max_age: float = MAX_AGE, max_fragments: int = MAX_FRAGMENTS):
+        self.path = Path(path)
+        self.max_age = max_age
+        self.max_fragments = max_fragments
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Batch workers write from several processes; wait for their locks
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS html_fragments ('
+            ' key TEXT PRIMARY KEY,'
+            ' html TEXT NOT NULL,'
+            ' summary INTEGER NOT NULL,'
+            ' rendered_at REAL NOT NULL) WITHOUT ROWID'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS html_fragments_rendered_at ON html_fragments (rendered_at)'
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Tuple[str, bool]]:
+        """{key: (html, summary found)} for the keys that are cached"""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            for i in range(0, len(keys), _QUERY_BATCH):
+                batch = keys[i:i + _QUERY_BATCH]
+                rows = self._conn.execute(
+                    'SELECT key, html, summary FROM html_fragments '
+                    f'WHERE key IN ({",".join("?" * len(batch))})', batch
+                ).fetchall()
+                found.update((key, (html, bool(summary))) for key, html, summary in rows)
+        return found
+
+    def put_many(self, fragments: Dict[str, Tuple[str, bool]]):
+        if not fragments:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO html_fragments (key, html, summary, rendered_at) '
+                'VALUES (?, ?, ?, ?)',
+                [(key, html, int(summary), now) for key, (html, summary) in fragments.items()]
+            )
+            self._prune(now)
+            self._conn.commit()
+
+    def _prune(self, now: float):
+        """Drop entries older than max_age, then the oldest beyond max_fragments"""
+        self._conn.execute('DELETE FROM html_fragments WHERE rendered_at < ?',
+                           (now - self.max_age,))
+        count, = self._conn.execute('SELECT COUNT(*) FROM html_fragments').fetchone()
+        if count > self.max_fragments:
+            self._conn.execute(
+                'DELETE FROM html_fragments WHERE key IN ('
+                ' SELECT key FROM html_fragments ORDER BY rendered_at LIMIT ?)',
+                (count - self.max_fragments,)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
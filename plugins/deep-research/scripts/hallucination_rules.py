@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Hallucination Rule Engine (CiteGuard patterns)
+
+Loads citation hallucination rules from rule packs and compiles them once:
+- regex rules are folded into a single pattern of optional lookaheads, so one
+  re.match call on a title reports every regex rule that matches
+- keyword rules share one Aho-Corasick automaton over the lowercased title
+- metadata rules (year / missing locator) need no title scan at all
+
+Rule pack format (JSON; YAML too when PyYAML is installed):
+
+    {"name": "...", "version": 1, "rules": [
+        {"id": "generic-academic-title", "match": "regex",
+         "pattern": "(A |An )?(Study|Review) (of|on)", "message": "..."},
+        {"id": "placeholder-title", "match": "keywords",
+         "keywords": ["tbd", "todo"], "message": "..."},
+        {"id": "future-year", "match": "metadata", "year_min": 2026,
+         "message": "Future year: {year}"}
+    ]}
+
+regex patterns are matched case-insensitively at the start of the title.
+Each one becomes a group of the combined pattern, which renumbers its
+groups: numbered backreferences (\\1, (?(1)...)) are rejected, and group
+names must be unique across rules and not of the form rN. Optional
+conditions on any rule: year_min, year_max, max_words, no_locator (entry has
+neither DOI nor URL). A later pack can override a rule by reusing its id.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from multi_pattern import AhoCorasick
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+DEFAULT_RULES_PATH = Path(__file__).parent / 'hallucination_rules.json'
+
+MATCH_TYPES = ('regex', 'keywords', 'metadata')
+
+# Group names RuleEngine gives each regex rule in the combined pattern
+RESERVED_GROUP = re.compile(r'r\d+$')
+
+
+def _numbered_backreference(pattern: str) -> Optional[str]:
+    """First numbered group reference in pattern (\\N or (?(N)...)), or None"""
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            m = re.match(r'[1-9]\d?', pattern[i + 1:])
+            # Inside a class, or with three octal digits, \N is an octal escape
+            if m and not in_class and not re.match(r'[0-7]{3}', pattern[i + 1:]):
+                return pattern[i:i + 1 + m.end()]
+            i += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+            # A ']' right after '[' or '[^' is a literal
+            i += 2 if pattern[i + 1:i + 2] == '^' else 1
+            if pattern[i:i + 1] == ']':
+                i += 1
+            continue
+        else:
+            m = re.match(r'\(\?\(\d+\)', pattern[i:])
+            if m:
+                return m.group(0)
+        i += 1
+    return None
+
+
+@dataclass
+class Rule:
+    """A single hallucination rule"""
+    id: str
+    match: str
+    message: str
+    pattern: Optional[str] = None
+    keywords: List[str] = field(default_factory=list)
+    year_min: Optional[int] = None
+    year_max: Optional[int] = None
+    max_words: Optional[int] = None
+    no_locator: bool = False
+
+    def conditions_hold(self, year: Optional[int], word_count: int, has_locator: bool) -> bool:
+        if self.year_min is not None and (year is None or year < self.year_min):
+            return False
+        if self.year_max is not None and (year is None or year > self.year_max):
+            return False
+        if self.max_words is not None and word_count > self.max_words:
+            return False
+        if self.no_locator and has_locator:
+            return False
+        return True
+
+
+def load_rule_pack(path: Path) -> List[Rule]:
+    """Parse and validate a JSON/YAML rule pack"""
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix in ('.yaml', '.yml'):
+            if yaml is None:
+                raise ValueError(f"{path}: YAML rule packs require PyYAML (pip install pyyaml)")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    rules = []
+    for raw in data.get('rules', []):
+        rule = Rule(**raw)
+        if rule.match not in MATCH_TYPES:
+            raise ValueError(f"{path}: rule {rule.id}: unknown match type '{rule.match}'")
+        if rule.match == 'regex':
+            if not rule.pattern:
+                raise ValueError(f"{path}: rule {rule.id}: regex rule needs a pattern")
+            try:
+                re.compile(rule.pattern)
+            except re.error as e:
+                raise ValueError(f"{path}: rule {rule.id}: invalid regex: {e}") from None
+            backreference = _numbered_backreference(rule.pattern)
+            if backreference:
+                raise ValueError(
+                    f"{path}: rule {rule.id}: numbered group reference '{backreference}' is not "
+                    f"supported (rules are combined into one pattern); use a named group "
+                    f"and (?P=name)"
+                )
+        if rule.match == 'keywords' and not rule.keywords:
+            raise ValueError(f"{path}: rule {rule.id}: keywords rule needs keywords")
+        rules.append(rule)
+    return rules
+
+
+class RuleEngine:
+    """Compiled rule set; scan() checks a title against all rules in one pass"""
+
+    def __init__(self, rules: List[Rule]):
+        by_id: Dict[str, Rule] = {}
+        for rule in rules:
+            by_id[rule.id] = rule
+        self.rules = list(by_id.values())
+
+        regex_parts = []
+        self._regex_groups: List[Tuple[int, str]] = []
+        keyword_patterns = []
+        self._metadata_rules = []
+        group_owners: Dict[str, str] = {}
+        for i, rule in enumerate(self.rules):
+            if rule.match == 'regex':
+                # All patterns share one group namespace in the combined regex
+                for name in re.compile(rule.pattern).groupindex:
+                    if RESERVED_GROUP.match(name):
+                        raise ValueError(f"rule {rule.id}: group name '{name}' is reserved")
+                    if name in group_owners:
+                        raise ValueError(f"rule {rule.id}: group name '{name}' is already "
+                                         f"used by rule {group_owners[name]}")
+                    group_owners[name] = rule.id
+                group = f'r{i}'
+                regex_parts.append(f'(?=(?P<{group}>{rule.pattern}))?')
+                self._regex_groups.append((i, group))
+            elif rule.match == 'keywords':
+                keyword_patterns.extend((kw.lower(), i) for kw in rule.keywords)
+            else:
+                self._metadata_rules.append(i)
+
+        self._regex = re.compile(''.join(regex_parts), re.IGNORECASE) if regex_parts else None
+        self._keywords = AhoCorasick(keyword_patterns) if keyword_patterns else None
+
+        digest = hashlib.sha256(
+            json.dumps([asdict(r) for r in self.rules], sort_keys=True).encode('utf-8')
+        )
+        self.fingerprint = digest.hexdigest()[:16]
+
+    @classmethod
+    def from_packs(cls, extra_paths: Optional[List[Path]] = None) -> 'RuleEngine':
+        """Default pack plus any extra packs (later packs override by id)"""
+        rules = load_rule_pack(DEFAULT_RULES_PATH)
+        for path in extra_paths or []:
+            rules.extend(load_rule_pack(path))
+        return cls(rules)
+
+    def scan(self, entry: Dict) -> List[Tuple[str, str]]:
+        """Return (rule_id, message) for every rule the entry triggers, in rule order"""
+        title = entry.get('title') or ''
+        if not title:
+            return []
+
+        candidates = set(self._metadata_rules)
+        if self._regex:
+            match = self._regex.match(title)
+            candidates.update(i for i, group in self._regex_groups if match.group(group) is not None)
+        if self._keywords:
+            candidates |= self._keywords.keys_in(title.lower())
+
+        year = int(entry['year']) if entry.get('year') else None
+        word_count = len(title.split())
+        has_locator = bool(entry.get('doi') or entry.get('url'))
+
+        hits = []
+        for i in sorted(candidates):
+            rule = self.rules[i]
+            if rule.conditions_hold(year, word_count, has_locator):
+                hits.append((rule.id, rule.message.replace('{year}', str(year))))
+        return hits
@@ -6,32 +6,54 @@ Converts a research report markdown file to styled HTML using
 type-specific templates from the templates/ directory.
 
 Usage:
-    python3 md_to_html.py <markdown_file> [--output <output_file>] [--open]
+    python3 md_to_html.py <markdown_file> [--output <output_file>] [--open] [--no-cache]
+    python3 md_to_html.py --batch <dir_or_glob> [...] [--jobs N] [--force] [--no-cache]
 
 The script:
 1. Reads the markdown report
 2. Detects research type from <!-- TYPE: xxx --> comment
 3. Selects the appropriate HTML template
 4. Extracts title, date, source count, metrics, content, bibliography
-5. Converts markdown content to HTML
+   from a single-pass parse (report_model.py)
+5. Converts markdown content to template-styled HTML in a single render
+   (Python-Markdown if installed, else the built-in stdlib_markdown.py),
+   one "##" section at a time: sections rendered before come from
+   ~/.claude/research_output/html_fragments.sqlite (fragment_cache.py), so
+   re-running after editing or appending one section renders only that one
 6. Fills the template and writes the output
+
+Batch mode converts every report matched by directories (*.md inside) or
+glob patterns on a process pool. Each worker keeps the templates and one
+resettable Markdown instance warm across reports. A report is skipped
+when its .html output is newer than the report and the templates, or was
+built from identical markdown and templates (the build stamp comment at
+the end of every output records their hash).
 """
 
 import argparse
+import hashlib
 import os
 import re
+import sqlite3
 import subprocess
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 try:
     import markdown
+    from report_markdown import ReportExtension
 except ImportError:
-    print("Installing required dependency: markdown...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "markdown", "-q"])
-    import markdown
+    markdown = None  # use the stdlib renderer (stdlib_markdown.py)
 
+import stdlib_markdown
+from fragment_cache import FragmentCache, fragment_key, split_sections
+from report_html import EXECUTIVE_SUMMARY_TITLES
+from report_model import ReportModel
+from report_paths import expand_report_paths
 
 # Template routing: research type -> HTML template filename
 TEMPLATE_ROUTING = {
@@ -45,187 +67,180 @@ TEMPLATE_ROUTING = {
 
 TEMPLATES_DIR = Path(__file__).parent.parent / "skills" / "deep-research" / "templates"
 
+# Bump when the HTML produced for the same markdown and templates changes
+RENDERER_VERSION = "2"
 
-def detect_research_type(md_content: str) -> str:
-    """Detect research type from <!-- TYPE: xxx --> comment in markdown."""
-    match = re.search(r"<!--\s*TYPE:\s*(\w+)\s*-->", md_content)
-    if match:
-        return match.group(1).lower()
-    return "general"
-
+# Recorded in build stamps, since the two renderers' output differs slightly
+RENDERER = (f"{RENDERER_VERSION}+markdown-{markdown.__version__}" if markdown
+            else f"{RENDERER_VERSION}+stdlib")
 
-def extract_title(md_content: str) -> str:
-    """Extract title from first # heading."""
-    match = re.search(r"^#\s+(.+)$", md_content, re.MULTILINE)
-    if match:
-        return match.group(1).strip()
-    return "Research Report"
+BUILD_STAMP = re.compile(r"<!-- md_to_html build: v(\S+) ([0-9a-f]+) -->")
 
 
-def extract_date(md_content: str) -> str:
-    """Extract date from Report Metadata or use today's date."""
-    match = re.search(r"\*\*Generated:\*\*\s*(.+)", md_content)
-    if match:
-        return match.group(1).strip()
-    return datetime.now().strftime("%Y-%m-%d")
-
+@lru_cache(maxsize=None)
+def load_template(template_file: str) -> str:
+    """Template text, read once per process."""
+    return (TEMPLATES_DIR / template_file).read_text(encoding="utf-8")
 
-def extract_source_count(md_content: str) -> str:
-    """Extract total source count from metadata or bibliography."""
-    # Try from Report Metadata
-    match = re.search(r"\*\*Total Sources:\*\*\s*(\d+)", md_content)
-    if match:
-        return match.group(1)
-    # Count bibliography entries
-    bib_entries = re.findall(r"^\[(\d+)\]", md_content, re.MULTILINE)
-    if bib_entries:
-        return str(len(bib_entries))
-    return "0"
 
+@lru_cache(maxsize=None)
+def _templates_state() -> tuple:
+    """(newest template mtime_ns, sha256 of all templates), once per process."""
+    digest = hashlib.sha256()
+    newest = 0
+    for path in sorted(TEMPLATES_DIR.glob("*.html")):
+        newest = max(newest, path.stat().st_mtime_ns)
+        digest.update(path.name.encode("utf-8") + b"\0" + path.read_bytes())
+    return newest, digest.hexdigest()
 
-def split_content_and_bibliography(md_content: str) -> tuple[str, str]:
-    """Split markdown into main content and bibliography section."""
-    # Find the Bibliography section (supports both English and Chinese)
-    bib_pattern = r"^##\s+(?:Bibliography|参考文献)\s*$"
-    match = re.search(bib_pattern, md_content, re.MULTILINE)
 
-    if not match:
-        return md_content, ""
+def build_stamp(md_bytes: bytes) -> str:
+    """Hash of the markdown, the templates and the renderer."""
+    digest = hashlib.sha256(f"{RENDERER}:{_templates_state()[1]}:".encode("utf-8"))
+    digest.update(md_bytes)
+    return digest.hexdigest()[:16]
 
-    bib_start = match.start()
 
-    # Find the next ## section after Bibliography (or end of file)
-    rest = md_content[match.end():]
-    next_section = re.search(r"^##\s+", rest, re.MULTILINE)
+def _stamp_comment(md_bytes: bytes) -> str:
+    return f"\n<!-- md_to_html build: v{RENDERER} {build_stamp(md_bytes)} -->\n"
 
-    if next_section:
-        bib_end = match.end() + next_section.start()
-        bibliography_md = md_content[match.end():bib_end].strip()
-    else:
-        bibliography_md = rest.strip()
-        bib_end = len(md_content)
 
-    return md_content[:bib_start], bibliography_md
+def is_up_to_date(md_path: Path, output_path: Path) -> bool:
+    """True if output_path was built by this renderer and is newer
+    than the markdown and templates, or was built from identical ones."""
+    try:
+        out = output_path.stat()
+        with open(output_path, "rb") as f:
+            f.seek(max(0, out.st_size - 256))
+            stamp = BUILD_STAMP.search(f.read().decode("utf-8", errors="replace"))
+    except FileNotFoundError:
+        return False
+    if not stamp or stamp.group(1) != RENDERER:
+        return False
+    if out.st_mtime_ns >= max(md_path.stat().st_mtime_ns, _templates_state()[0]):
+        return True
+    return stamp.group(2) == build_stamp(md_path.read_bytes())
 
 
-def extract_main_content(md_content: str) -> str:
-    """Extract the main report content, excluding title line, TYPE comment,
-    template reference comments, Report Metadata, and Appendix sections."""
-    lines = md_content.split("\n")
-    content_lines = []
-    found_first_heading = False
-    stop_entirely = False
+def detect_research_type(report: ReportModel) -> str:
+    """Research type from the <!-- TYPE: xxx --> comment (default: general)."""
+    return report.research_type
 
-    for line in lines:
-        stripped = line.strip()
 
-        if stop_entirely:
-            break
+def extract_title(report: ReportModel) -> str:
+    """Title from the first # heading."""
+    return report.title or "Research Report"
 
-        # Skip the first # heading (title)
-        if not found_first_heading and re.match(r"^#\s+", stripped):
-            found_first_heading = True
-            continue
-
-        # Skip HTML comments (TYPE, template references)
-        if re.match(r"^<!--.*-->$", stripped):
-            continue
-
-        # Stop entirely at Report Metadata (everything after is trailing)
-        if re.match(r"^##\s+(?:Report Metadata|报告元数据)", stripped):
-            stop_entirely = True
-            continue
 
-        # Skip Appendix sections but continue looking for more content
-        if re.match(r"^##\s+(?:Appendix|附录)", stripped):
-            # Skip until next ## that isn't Appendix or Report Metadata
-            continue
-
-        # Stop at Bibliography (handled separately)
-        if re.match(r"^##\s+(?:Bibliography|参考文献)", stripped):
-            continue
-
-        content_lines.append(line)
-
-    return "\n".join(content_lines).strip()
+def extract_date(report: ReportModel) -> str:
+    """Date from Report Metadata, or today's date."""
+    generated = report.metadata.get("generated")
+    if generated:
+        return generated.strip()
+    return datetime.now().strftime("%Y-%m-%d")
 
 
-def convert_md_to_html(md_text: str) -> str:
-    """Convert markdown text to HTML using Python-Markdown with extensions."""
-    md = markdown.Markdown(
+def extract_source_count(report: ReportModel) -> str:
+    """Total source count from metadata, else the number of [N] entry lines."""
+    if "total_sources" in report.metadata:
+        return report.metadata["total_sources"]
+    return str(report.bib_entry_count)
+
+
+def split_content_and_bibliography(report: ReportModel) -> tuple[str, str]:
+    """Main content (everything before the bibliography) and bibliography markdown."""
+    return report.content_before_bibliography, report.bibliography_md
+
+
+def extract_main_content(report: ReportModel) -> str:
+    """The main report content, excluding title line, TYPE comment,
+    template reference comments, Report Metadata, and Appendix headings."""
+    return report.content_md
+
+
+def convert_md_to_html(md_text: str, cache: Optional[FragmentCache] = None) -> str:
+    """Convert markdown text to template-ready HTML.
+
+    Uses Python-Markdown when it is installed, else the pure-stdlib
+    renderer in stdlib_markdown.py. Either way template classes, citation
+    spans, the executive-summary wrapper and emoji removal are applied
+    during the render (report_html.py), not by regex passes over the output.
+
+    With a cache, only the "##" sections not rendered before are converted
+    (fragment_cache.py); the result is the same.
+    """
+    if cache is None:
+        return _render(md_text)[0]
+    return _render_sections(md_text, cache)
+
+
+def _render(md_text: str, summary: bool = True, summary_to_end: bool = False) -> Tuple[str, bool]:
+    """(HTML, whether the Executive Summary heading was found); summary and
+    summary_to_end are passed to report_html.style_tree()."""
+    if markdown is None:
+        return stdlib_markdown.render_section(md_text, summary, summary_to_end)
+    md = _markdown()
+    md.reset()
+    style = md.treeprocessors["report_style"]
+    style.summary, style.summary_to_end, style.summary_found = summary, summary_to_end, False
+    return md.convert(md_text), style.summary_found
+
+
+def _render_sections(md_text: str, cache: FragmentCache) -> str:
+    """convert_md_to_html() one section at a time, reusing cached sections."""
+    sections = split_sections(md_text)
+    last = len(sections) - 1
+    # The Executive Summary wrapper goes in the first section holding its
+    # heading; only sections mentioning a summary title are candidates
+    candidates = {i for i, section in enumerate(sections)
+                  if any(title in section for title in EXECUTIVE_SUMMARY_TITLES)}
+
+    def key(i: int, mode: str) -> str:
+        return fragment_key(sections[i], RENDERER, mode)
+
+    def summary_mode(i: int) -> str:
+        return "open" if i == last else "closed"
+
+    try:
+        cached = cache.get_many([key(i, "") for i in range(len(sections))]
+                                + [key(i, summary_mode(i)) for i in candidates])
+    except sqlite3.Error as e:
+        print(f"Warning: section cache unreadable, rendering all sections: {e}", file=sys.stderr)
+        cached = {}
+    rendered = {}
+    fragments = []
+    summary_pending = True
+    for i, section in enumerate(sections):
+        mode = summary_mode(i) if summary_pending and i in candidates else ""
+        k = key(i, mode)
+        fragment = cached.get(k) or rendered.get(k)
+        if fragment:
+            cache.hits += 1
+        else:
+            cache.misses += 1
+            fragment = rendered[k] = _render(section, bool(mode), mode == "closed")
+        html, found = fragment
+        summary_pending = summary_pending and not found
+        fragments.append(html)
+    try:
+        cache.put_many(rendered)
+    except sqlite3.Error as e:
+        print(f"Warning: could not save rendered sections: {e}", file=sys.stderr)
+    return "\n".join(fragment for fragment in fragments if fragment)
+
+
+@lru_cache(maxsize=None)
+def _markdown() -> "markdown.Markdown":
+    """One Markdown instance per process; convert_md_to_html() resets it per document."""
+    return markdown.Markdown(
         extensions=[
             "tables",
             "fenced_code",
             "sane_lists",
+            ReportExtension(),
         ],
         output_format="html5",
     )
-    return md.convert(md_text)
-
-
-def post_process_html(html: str) -> str:
-    """Apply template-specific CSS classes to converted HTML elements."""
-
-    # Add CSS classes to headings
-    html = re.sub(
-        r"<h2>(.*?)</h2>",
-        r'<div class="section-title">\1</div>',
-        html,
-    )
-    html = re.sub(
-        r"<h3>(.*?)</h3>",
-        r'<div class="subsection-title">\1</div>',
-        html,
-    )
-
-    # Add CSS class to tables
-    html = html.replace("<table>", '<table class="data-table">')
-
-    # Convert citation references [N] to styled spans
-    html = re.sub(
-        r"\[(\d+)\]",
-        r'<span class="citation">[\1]</span>',
-        html,
-    )
-
-    # Wrap Executive Summary content in styled div (supports both Chinese and English)
-    html = re.sub(
-        r'(<div class="section-title">(?:Executive Summary|执行摘要)</div>\s*)(.*?)(<div class="section-title">)',
-        lambda m: (
-            m.group(1)
-            + '<div class="executive-summary">'
-            + m.group(2)
-            + "</div>"
-            + m.group(3)
-        ),
-        html,
-        count=1,
-        flags=re.DOTALL,
-    )
-
-    # Remove emojis (careful to avoid CJK ranges U+4E00-U+9FFF)
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map
-        "\U0001F1E0-\U0001F1FF"  # flags
-        "\U0001F900-\U0001F9FF"  # supplemental symbols
-        "\U0001FA00-\U0001FA6F"  # chess symbols
-        "\U0001FA70-\U0001FAFF"  # symbols extended-A
-        "\u2702-\u27B0"          # dingbats
-        "\u2600-\u26FF"          # misc symbols
-        "\u2700-\u27BF"          # dingbats
-        "\u23E9-\u23F3"          # media control
-        "\u23F8-\u23FA"          # media control
-        "\u200d"                 # zero width joiner
-        "\ufe0f"                 # variation selector
-        "]+",
-        flags=re.UNICODE,
-    )
-    html = emoji_pattern.sub("", html)
-
-    return html
 
 
 def format_bibliography(bib_md: str) -> str:
@@ -258,31 +273,25 @@ def format_bibliography(bib_md: str) -> str:
     return "\n".join(entries)
 
 
-def build_metrics_dashboard(md_content: str, research_type: str) -> str:
+def build_metrics_dashboard(report: ReportModel, research_type: str) -> str:
     """Build metrics dashboard HTML from report metadata."""
-    source_count = extract_source_count(md_content)
+    source_count = extract_source_count(report)
 
-    # Extract research mode
-    mode_match = re.search(r"\*\*Research Mode:\*\*\s*(.+)", md_content)
-    mode = mode_match.group(1).strip() if mode_match else "Standard"
+    mode = report.metadata.get("research_mode", "Standard").strip()
 
     # Count sections (## headings)
-    sections = re.findall(r"^##\s+", md_content, re.MULTILINE)
-    section_count = len(sections)
+    section_count = len(report.sections)
 
     # Estimate word count
-    word_count = len(md_content.split())
+    word_count = report.word_count
     if word_count >= 1000:
         word_display = f"{word_count // 1000}K+"
     else:
         word_display = str(word_count)
 
-    # Extract confidence level if present
-    confidence_match = re.search(
-        r"\*\*(?:信心等级|Confidence Level|信心水平)\*?\*?[:：]\s*(.+?)(?:\n|$)",
-        md_content,
-    )
-    confidence = confidence_match.group(1).strip() if confidence_match else None
+    # Confidence level if present
+    confidence = report.metadata.get("confidence")
+    confidence = confidence.strip() if confidence is not None else None
 
     metrics = [
         ("Sources", source_count),
@@ -317,66 +326,82 @@ def build_metrics_dashboard(md_content: str, research_type: str) -> str:
     )
 
 
-def convert_report(md_path: str, output_path: str = None, open_browser: bool = False):
-    """Main conversion function."""
-    md_path = Path(md_path)
-    if not md_path.exists():
-        print(f"Error: File not found: {md_path}", file=sys.stderr)
-        sys.exit(1)
+def select_template(research_type: str) -> str:
+    """Template filename for a research type."""
+    return TEMPLATE_ROUTING.get(research_type, TEMPLATE_ROUTING["general"])
 
-    # Read markdown
-    md_content = md_path.read_text(encoding="utf-8")
 
-    # Detect research type and select template
-    research_type = detect_research_type(md_content)
-    template_file = TEMPLATE_ROUTING.get(research_type, TEMPLATE_ROUTING["general"])
-    template_path = TEMPLATES_DIR / template_file
+@lru_cache(maxsize=None)
+def _fragment_cache() -> Optional[FragmentCache]:
+    """One section cache connection per process, or None (with a warning)
+    if it cannot be opened; conversion then renders every section."""
+    try:
+        return FragmentCache()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: section cache unavailable, rendering uncached: {e}", file=sys.stderr)
+        return None
 
-    if not template_path.exists():
-        print(f"Error: Template not found: {template_path}", file=sys.stderr)
-        sys.exit(1)
 
-    print(f"Research type: {research_type}")
-    print(f"Template: {template_file}")
-
-    # Read template
-    template = template_path.read_text(encoding="utf-8")
-
-    # Extract components
-    title = extract_title(md_content)
-    date = extract_date(md_content)
-    source_count = extract_source_count(md_content)
-
-    print(f"Title: {title}")
-    print(f"Date: {date}")
-    print(f"Sources: {source_count}")
-
-    # Split content and bibliography
-    content_md_full, bibliography_md = split_content_and_bibliography(md_content)
-
-    # Extract main content (excluding title, metadata, appendix)
-    main_content_md = extract_main_content(content_md_full)
+def render_report(report: ReportModel, cache: Optional[FragmentCache] = None) -> str:
+    """Fill the report's template with its converted content."""
+    research_type = detect_research_type(report)
+    template = load_template(select_template(research_type))
 
     # Convert markdown to HTML
-    content_html = convert_md_to_html(main_content_md)
-    content_html = post_process_html(content_html)
+    content_html = convert_md_to_html(extract_main_content(report), cache)
 
     # Format bibliography
-    bibliography_html = format_bibliography(bibliography_md)
+    bibliography_html = format_bibliography(report.bibliography_md)
 
     # Build metrics dashboard
-    metrics_html = build_metrics_dashboard(md_content, research_type)
+    metrics_html = build_metrics_dashboard(report, research_type)
 
     # Fill template
-    html = template.replace("{{TITLE}}", title)
-    html = html.replace("{{DATE}}", date)
-    html = html.replace("{{SOURCE_COUNT}}", source_count)
+    html = template.replace("{{TITLE}}", extract_title(report))
+    html = html.replace("{{DATE}}", extract_date(report))
+    html = html.replace("{{SOURCE_COUNT}}", extract_source_count(report))
     html = html.replace("{{METRICS_DASHBOARD}}", metrics_html)
     html = html.replace("{{CONTENT}}", content_html)
     html = html.replace("{{BIBLIOGRAPHY}}", bibliography_html)
 
     # Set language to zh-CN for Chinese reports
     html = html.replace('<html lang="en">', '<html lang="zh-CN">')
+    return html
+
+
+def convert_report(md_path: str, output_path: str = None, open_browser: bool = False,
+                   use_cache: bool = True):
+    """Main conversion function."""
+    md_path = Path(md_path)
+    if not md_path.exists():
+        print(f"Error: File not found: {md_path}", file=sys.stderr)
+        sys.exit(1)
+
+    # Read markdown and parse it once; every extractor reads the model
+    md_bytes = md_path.read_bytes()
+    report = ReportModel.parse(md_bytes.decode("utf-8"))
+
+    # Detect research type and select template
+    research_type = detect_research_type(report)
+    template_file = select_template(research_type)
+    template_path = TEMPLATES_DIR / template_file
+
+    if not template_path.exists():
+        print(f"Error: Template not found: {template_path}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Research type: {research_type}")
+    print(f"Template: {template_file}")
+    print(f"Title: {extract_title(report)}")
+    print(f"Date: {extract_date(report)}")
+    print(f"Sources: {extract_source_count(report)}")
+    if markdown is None:
+        print("Renderer: built-in (markdown library not installed)")
+
+    cache = _fragment_cache() if use_cache else None
+    html = render_report(report, cache) + _stamp_comment(md_bytes)
+    if cache:
+        print(f"Sections: {cache.misses} rendered, {cache.hits} cached")
 
     # Determine output path
     if output_path is None:
@@ -398,20 +423,104 @@ def convert_report(md_path: str, output_path: str = None, open_browser: bool = F
         print("Opened in browser.")
 
 
+def _convert_one(md_path: str, force: bool = False, use_cache: bool = True) -> Dict:
+    """Convert one report unless its output is up to date (process-pool worker)."""
+    started = time.perf_counter()
+    source = Path(md_path)
+    output = source.with_suffix(".html")
+    result = {"source": md_path, "output": str(output), "error": None}
+    try:
+        if not force and is_up_to_date(source, output):
+            result["status"] = "skipped"
+        else:
+            md_bytes = source.read_bytes()
+            cache = _fragment_cache() if use_cache else None
+            html = render_report(ReportModel.parse(md_bytes.decode("utf-8")), cache)
+            output.write_text(html + _stamp_comment(md_bytes), encoding="utf-8")
+            result["status"] = "built"
+    except (OSError, UnicodeDecodeError, sqlite3.Error) as e:
+        result.update(status="failed", error=str(e))
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def convert_batch(md_paths: List[Path], jobs: Optional[int] = None, force: bool = False,
+                  use_cache: bool = True) -> bool:
+    """Convert reports on a process pool, printing each result as it
+    completes. Returns True if none failed."""
+    # Only batch mode needs the process pool machinery; keep single runs lean
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(md_paths)))
+    started = time.perf_counter()
+    counts = {"built": 0, "skipped": 0, "failed": 0}
+
+    def report(result: Dict):
+        counts[result["status"]] += 1
+        if result["status"] == "built":
+            print(f"built    {result['source']} -> {result['output']} ({result['seconds'] * 1000:.0f}ms)")
+        elif result["status"] == "skipped":
+            print(f"skipped  {result['source']} (up to date)")
+        else:
+            print(f"failed   {result['source']}: {result['error']}", file=sys.stderr)
+
+    if jobs == 1:
+        for path in md_paths:
+            report(_convert_one(str(path), force, use_cache))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_convert_one, str(path), force, use_cache) for path in md_paths]
+            for future in as_completed(futures):
+                report(future.result())
+
+    print(f"\n{counts['built']} built, {counts['skipped']} up to date, {counts['failed']} failed "
+          f"in {time.perf_counter() - started:.2f}s ({jobs} jobs)")
+    return counts["failed"] == 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert Deep Research markdown reports to styled HTML."
     )
-    parser.add_argument("markdown_file", help="Path to the markdown report file")
+    parser.add_argument("markdown_file", nargs="?", help="Path to the markdown report file")
     parser.add_argument(
         "--output", "-o", help="Output HTML file path (default: same name with .html)"
     )
     parser.add_argument(
         "--open", action="store_true", help="Open the HTML file in browser after conversion"
     )
+    parser.add_argument(
+        "--batch", "-b", nargs="+", metavar="PATH_OR_GLOB",
+        help="Convert all reports in these directories (*.md inside) or glob patterns",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Reports to convert in parallel in batch mode (default: CPU count)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="In batch mode, rebuild outputs that are up to date"
+    )
+
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Render every section instead of reusing cached section HTML",
+    )
 
     args = parser.parse_args()
-    convert_report(args.markdown_file, args.output, args.open)
+
+    if args.batch:
+        if args.markdown_file or args.output or args.open:
+            parser.error("--batch cannot be combined with a markdown file, --output or --open")
+        md_paths = expand_report_paths(args.batch)
+        if not md_paths:
+            print(f"Error: No reports matched: {' '.join(args.batch)}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0 if convert_batch(md_paths, jobs=args.jobs, force=args.force,
+                                    use_cache=not args.no_cache) else 1)
+
+    if not args.markdown_file:
+        parser.error("a markdown file or --batch is required")
+    convert_report(args.markdown_file, args.output, args.open, use_cache=not args.no_cache)
 
 
 if __name__ == "__main__":
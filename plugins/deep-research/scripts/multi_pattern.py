@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Aho-Corasick multi-pattern matcher
+
+Finds every occurrence of any of a set of literal patterns in one pass over
+the text, regardless of how many patterns there are. Used by the citation
+rule engine and the report validator's placeholder/truncation scanner.
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """Literal multi-pattern automaton built once, scanned many times"""
+
+    def __init__(self, patterns: Iterable[Tuple[str, Hashable]]):
+        """patterns: (literal, key) pairs; the same literal may carry several keys"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Hashable]]] = [[]]
+
+        for literal, key in patterns:
+            if not literal:
+                continue
+            state = 0
+            for ch in literal:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((len(literal), key))
+
+        # Breadth-first failure links (root children fail to root); outputs
+        # inherit their fallback state's outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, Hashable]]:
+        """Yield (start, end, key) for every (possibly overlapping) match"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, key in out[state]:
+                yield i + 1 - length, i + 1, key
+
+    def keys_in(self, text: str) -> set:
+        """Set of keys whose literal occurs anywhere in text"""
+        return {key for _, _, key in self.finditer(text)}
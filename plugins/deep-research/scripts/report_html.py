@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Template styling of rendered report HTML
+
+The HTML templates expect report content in a particular shape:
+
+- "##" headings as <div class="section-title">, "###" as
+  <div class="subsection-title">
+- tables with class "data-table"
+- citation markers [N] wrapped in <span class="citation">, also in the
+  text of raw HTML blocks (mark_raw_html)
+- the Executive Summary body wrapped in <div class="executive-summary">
+- no emoji (CJK text is left alone)
+
+style_tree() applies all of this to the element tree of a render in one
+walk, instead of one regex pass over the finished HTML per rule, and
+expand_citations() fills in the citation spans after serialization.
+Working on the tree also keeps markers inside code and link URLs as
+they are.
+"""
+
+import re
+import xml.etree.ElementTree as etree
+
+CITATION = re.compile(r'\[(\d+)\]')
+
+# Citation spans would be thousands of extra elements to serialize; the tree
+# carries a placeholder instead (control characters never occur in report
+# text) and expand_citations() swaps in the markup afterwards
+CITATION_MARK = '\x02cite:\\1\x03'
+CITATION_PLACEHOLDER = re.compile('\x02cite:(\\d+)\x03')
+
+EXECUTIVE_SUMMARY_TITLES = ('Executive Summary', '执行摘要')
+
+# Emoji ranges (careful to avoid CJK ranges U+4E00-U+9FFF)
+EMOJI = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U0001F900-\U0001F9FF"  # supplemental symbols
+    "\U0001FA00-\U0001FA6F"  # chess symbols
+    "\U0001FA70-\U0001FAFF"  # symbols extended-A
+    "\u2702-\u27B0"          # dingbats
+    "\u2600-\u26FF"          # misc symbols
+    "\u2700-\u27BF"          # dingbats
+    "\u23E9-\u23F3"          # media control
+    "\u23F8-\u23FA"          # media control
+    "\u200d"                 # zero width joiner
+    "\ufe0f"                 # variation selector
+    "]+",
+    flags=re.UNICODE,
+)
+
+CODE_TAGS = ('code', 'pre')
+
+_HTML_TAG = re.compile(r'(<[^>]*>)')
+
+_RETAG = {
+    'h2': ('div', 'section-title'),
+    'h3': ('div', 'subsection-title'),
+    'table': ('table', 'data-table'),
+}
+
+
+def strip_emoji(text):
+    """Text without emoji, keeping its str subclass (e.g. Markdown's AtomicString)"""
+    if not text or text.isascii():
+        return text
+    stripped = EMOJI.sub('', text)
+    return text if stripped == text else type(text)(stripped)
+
+
+def _wrap_executive_summary(root: etree.Element, to_end: bool = False) -> bool:
+    """
+    Move the blocks between the Executive Summary heading and the next
+    "##" heading into <div class="executive-summary">. Like the template
+    always did, nothing is wrapped when no "##" heading follows, unless
+    to_end is set (root is one section of a report, followed by others).
+    Returns whether the heading was found.
+    """
+    children = list(root)
+    start = None
+    end = len(children) if to_end else None
+    for i, el in enumerate(children):
+        if el.tag != 'h2' or el.attrib:
+            continue
+        if start is None:
+            if len(el) == 0 and el.text in EXECUTIVE_SUMMARY_TITLES:
+                start = i
+        else:
+            end = i
+            break
+    if start is None or end is None:
+        return start is not None
+    wrapper = etree.Element('div', {'class': 'executive-summary'})
+    for block in children[start + 1:end]:
+        root.remove(block)
+        wrapper.append(block)
+    root.insert(start + 1, wrapper)
+    return True
+
+
+def _style(el: etree.Element, in_code: bool):
+    retag = _RETAG.get(el.tag)
+    if retag and not el.attrib:
+        el.tag = retag[0]
+        el.set('class', retag[1])
+    for name, value in el.attrib.items():
+        el.set(name, strip_emoji(value))
+    in_code = in_code or el.tag in CODE_TAGS
+
+    el.text = _mark_citations(strip_emoji(el.text), in_code)
+    for child in el:
+        _style(child, in_code)
+        child.tail = _mark_citations(strip_emoji(child.tail), in_code)
+
+
+def _mark_citations(text, in_code: bool):
+    if in_code or not text or '[' not in text:
+        return text
+    return type(text)(CITATION.sub(CITATION_MARK, text))
+
+
+def style_tree(root: etree.Element, summary: bool = True, summary_to_end: bool = False) -> bool:
+    """
+    Apply the template styling to a rendered report body, in place.
+    Citations are left as placeholders; pass the serialized HTML through
+    expand_citations().
+
+    summary=False skips the Executive Summary wrapper, and summary_to_end
+    wraps up to the end of root (see _wrap_executive_summary); both are for
+    rendering a report one section at a time. Returns whether the
+    Executive Summary heading was found.
+    """
+    found = summary and _wrap_executive_summary(root, summary_to_end)
+    _style(root, False)
+    return found
+
+
+def mark_raw_html(html: str) -> str:
+    """
+    Citation placeholders for a raw HTML block passed through the render:
+    markers in text between tags are marked, tags and their attributes are
+    left as they are.
+    """
+    if '[' not in html:
+        return html
+    return type(html)(''.join(part if part.startswith('<') else CITATION.sub(CITATION_MARK, part)
+                              for part in _HTML_TAG.split(html)))
+
+
+def expand_citations(html: str) -> str:
+    """Turn the citation placeholders left by style_tree() into citation spans"""
+    if '\x02cite:' not in html:
+        return html
+    return CITATION_PLACEHOLDER.sub(r'<span class="citation">[\1]</span>', html)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Single-pass report index
+
+ReportIndex.build() streams a report once, line by line, from its memory map
+(see bib_stream.py) and records everything the validation checks need:
+
+- headings and the "##" sections they open (byte spans, line ranges, words)
+- paragraphs: runs of non-blank, non-heading lines (byte spans, line ranges)
+- citation markers [N] with byte offset, line and column
+- internal link targets [text](./path)
+- bibliography entry numbers
+- every placeholder / truncation phrase hit (report_patterns.py);
+  bibliography-only phrases are only looked for in the bibliography
+- the research type from a <!-- TYPE: xxx --> marker (as in md_to_html.py)
+
+Checks then read the index instead of rescanning the text, so adding a check
+does not add a pass over the document. A section body runs from its heading
+line to the next heading line that starts with "##" (the original per-check
+regexes also stopped at a "##" in the middle of a line).
+"""
+
+import bisect
+import re
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from bib_stream import MappedReport, BIB_HEADING
+from report_patterns import PhraseScanner
+
+MARKER = re.compile(r'\[(\d+)\]')
+INTERNAL_LINK = re.compile(r'\[.*?\]\((\.\/.*?)\)')
+BIB_ENTRY = re.compile(r'\[(\d+)\]')
+BIB_TITLE = re.compile(BIB_HEADING.pattern.decode('utf-8'), re.IGNORECASE)
+TYPE_MARKER = re.compile(r'<!--\s*TYPE:\s*(\w+)\s*-->')
+
+
+@dataclass
+class Heading:
+    level: int
+    title: str
+    line: int
+    offset: int
+
+
+@dataclass
+class Section:
+    heading: Heading
+    start: int  # byte offset of the first body line
+    end: int  # byte offset just past the last body line
+    first_line: int
+    last_line: int
+    words: int = 0
+    # Index state when the heading was reached, for ReportIndex.update()
+    checkpoint: Tuple = field(default=(), repr=False, compare=False)
+
+
+@dataclass
+class Paragraph:
+    start: int  # byte offset of the first line
+    end: int  # byte offset just past the last line
+    first_line: int
+    last_line: int
+
+
+@dataclass
+class Marker:
+    num: str
+    offset: int
+    line: int
+    column: int
+
+
+@dataclass
+class Link:
+    target: str
+    offset: int
+    line: int
+    column: int
+
+
+@dataclass
+class PhraseHit:
+    group: str
+    pattern: str  # pattern id
+    description: str
+    text: str
+    offset: int
+    line: int
+    column: int
+
+
+def _byte_offsets(line_offset: int, line: str) -> Callable[[int], int]:
+    """
+    Map columns of line to byte offsets. Columns usually arrive in increasing
+    order, so each character is encoded once instead of once per match.
+    """
+    if line.isascii():
+        return lambda column: line_offset + column
+    state = [0, line_offset]
+
+    def at(column: int) -> int:
+        if column < state[0]:
+            state[:] = [0, line_offset]
+        state[1] += len(line[state[0]:column].encode('utf-8'))
+        state[0] = column
+        return state[1]
+    return at
+
+
+def _first_difference(old: bytes, new) -> Optional[int]:
+    """Offset of the first differing byte, or None if old and new are equal"""
+    n = min(len(old), len(new))
+    step = 1 << 16
+    for pos in range(0, n, step):
+        end = min(pos + step, n)
+        if old[pos:end] != new[pos:end]:
+            lo, hi = pos, end
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if old[lo:mid] != new[lo:mid]:
+                    hi = mid
+                else:
+                    lo = mid
+            return lo
+    return None if len(old) == len(new) else n
+
+
+@dataclass
+class ReportIndex:
+    """Everything the validator needs from one streamed pass over a report"""
+    path: Path
+    size: int = 0
+    lines: int = 0
+    word_count: int = 0
+    headings: List[Heading] = field(default_factory=list)
+    sections: List[Section] = field(default_factory=list)
+    paragraphs: List[Paragraph] = field(default_factory=list)
+    markers: List[Marker] = field(default_factory=list)
+    links: List[Link] = field(default_factory=list)
+    bibliography: Optional[Section] = None
+    bib_entries: List[str] = field(default_factory=list)
+    hits: List[PhraseHit] = field(default_factory=list)
+    research_type: Optional[str] = None
+
+    data: Optional[bytes] = field(default=None, repr=False)
+
+    @classmethod
+    def build(cls, path: Path, scanner: Optional[PhraseScanner] = None,
+              keep_data: bool = False) -> 'ReportIndex':
+        """
+        Index the report at path, recording every hit of the scanner's phrases.
+        keep_data keeps the bytes so update() can find what changed; the file
+        is then read rather than mapped, as it is expected to change under us.
+        """
+        index = cls(Path(path))
+        with MappedReport(index.path, in_memory=keep_data) as report:
+            index._scan(report, 0, scanner)
+            if keep_data:
+                index.data = report.data
+        return index
+
+    def _checkpoint(self) -> Tuple:
+        return (self.lines, self.word_count, len(self.headings), len(self.sections),
+                len(self.paragraphs), len(self.markers), len(self.links), len(self.hits),
+                len(self.bib_entries), self.bibliography, self.research_type)
+
+    def _restore(self, checkpoint: Tuple):
+        (self.lines, self.word_count, headings, sections, paragraphs, markers, links, hits,
+         bib_entries, self.bibliography, self.research_type) = checkpoint
+        del self.headings[headings:], self.sections[sections:], self.paragraphs[paragraphs:]
+        del self.markers[markers:], self.links[links:], self.hits[hits:], self.bib_entries[bib_entries:]
+
+    def _scan(self, report: MappedReport, start: int, scanner: Optional[PhraseScanner]):
+        """Tokenize report.data from byte offset start (a line start) to EOF"""
+        self.size = len(report.data)
+        # Lines up to the next heading still belong to the last kept section
+        current = self.sections[-1] if self.sections else None
+        if current:
+            current.end = self.size
+        in_bibliography = current is not None and current is self.bibliography
+        # A paragraph cut off by the heading at start goes on if that line is no longer a heading
+        paragraph = None
+        if start and self.paragraphs and self.paragraphs[-1].end == start:
+            paragraph = self.paragraphs[-1]
+            paragraph.end = self.size
+        for line_no, (offset, line) in enumerate(report.iter_line_spans(start), self.lines + 1):
+            words = len(line.split())
+
+            stripped = line.lstrip()
+            if not stripped or stripped.startswith('#'):
+                if paragraph:
+                    paragraph.end = offset
+                    paragraph = None
+            elif paragraph:
+                paragraph.last_line = line_no
+            else:
+                paragraph = Paragraph(offset, self.size, line_no, line_no)
+                self.paragraphs.append(paragraph)
+
+            if stripped.startswith('#'):
+                level = len(stripped) - len(stripped.lstrip('#'))
+                heading = Heading(level, stripped[level:].strip(), line_no, offset)
+                if level >= 2:
+                    checkpoint = self._checkpoint()
+                    if current:
+                        current.end = offset
+                    body_start = report.data.find(b'\n', offset) + 1 or self.size
+                    current = Section(heading, body_start, self.size, line_no + 1, line_no,
+                                      checkpoint=checkpoint)
+                    self.sections.append(current)
+                    in_bibliography = (self.bibliography is None
+                                       and BIB_TITLE.search(stripped) is not None)
+                    if in_bibliography:
+                        self.bibliography = current
+                self.headings.append(heading)
+            elif current:
+                current.words += words
+                current.last_line = line_no
+                if in_bibliography:
+                    entry = BIB_ENTRY.match(line)
+                    if entry:
+                        self.bib_entries.append(entry.group(1))
+            self.word_count += words
+
+            if '[' in line:
+                at = _byte_offsets(offset, line)
+                for m in MARKER.finditer(line):
+                    self.markers.append(Marker(m.group(1), at(m.start()), line_no, m.start() + 1))
+                if '](./' in line:
+                    for m in INTERNAL_LINK.finditer(line):
+                        # Position of the target (the non-greedy match may start at an earlier '[')
+                        self.links.append(Link(m.group(1), at(m.start(1)), line_no, m.start(1) + 1))
+
+            if self.research_type is None and '<!--' in line:
+                marker = TYPE_MARKER.search(line)
+                if marker:
+                    self.research_type = marker.group(1).lower()
+
+            if scanner:
+                at = None
+                # The heading line is outside the section body it opens
+                in_body = in_bibliography and line_no >= current.first_line
+                for pattern, hit_start, hit_end in scanner.scan(line, in_body):
+                    at = at or _byte_offsets(offset, line)
+                    self.hits.append(PhraseHit(
+                        pattern.group, pattern.id, pattern.description, line[hit_start:hit_end],
+                        at(hit_start), line_no, hit_start + 1))
+            self.lines = line_no
+
+    def update(self, scanner: Optional[PhraseScanner] = None) -> Set[str]:
+        """
+        Re-index after the file changed (requires keep_data). Everything
+        before the first changed byte is kept; tokenizing resumes at the
+        heading of the section containing it. Returns the facets whose
+        tokens changed: sections, markers, links, words, bibliography, type
+        and each phrase group name.
+        """
+        if self.data is None:
+            raise ValueError("update() needs an index built with keep_data=True")
+        # Read, not mapped: an editor may truncate the file while we scan it
+        with MappedReport(self.path, in_memory=True) as report:
+            diff = _first_difference(self.data, report.data)
+            if diff is None:
+                return set()
+
+            # Resume at the last section whose heading starts before the change;
+            # a change right at a heading can merge it into the previous section
+            k = bisect.bisect_left([s.heading.offset for s in self.sections], diff) - 1
+            before = self._facets()
+            if k < 0:
+                self._restore((0, 0, 0, 0, 0, 0, 0, 0, 0, None, None))
+                start = 0
+            else:
+                start = self.sections[k].heading.offset
+                self._restore(self.sections[k].checkpoint)
+            self._scan(report, start, scanner)
+            self.data = report.data
+
+        after = self._facets()
+        return {facet for facet in after.keys() | before.keys() if before.get(facet) != after.get(facet)}
+
+    def _facets(self) -> Dict[str, object]:
+        facets = {
+            'sections': [replace(s) for s in self.sections],
+            'markers': list(self.markers),
+            'links': list(self.links),
+            'words': self.word_count,
+            'bibliography': (replace(self.bibliography) if self.bibliography else None,
+                             list(self.bib_entries)),
+            'type': self.research_type,
+        }
+        for hit in self.hits:
+            facets.setdefault(hit.group, []).append(hit)
+        return facets
+
+    def find_section(self, names: List[str]) -> Optional[Section]:
+        """First "##" section whose title starts with one of names (case-insensitive)"""
+        prefixes = tuple(n.lower() for n in names)
+        for section in self.sections:
+            if section.heading.title.lower().startswith(prefixes):
+                return section
+        return None
+
+    def has_heading(self, names: List[str]) -> bool:
+        """True if any "##" heading mentions one of names (case-insensitive)"""
+        pattern = re.compile('|'.join(re.escape(n) for n in names), re.IGNORECASE)
+        return any(pattern.search(s.heading.title) for s in self.sections)
+
+    def hits_in(self, group: str, section: Optional[Section] = None) -> List[PhraseHit]:
+        """Phrase hits of a group, optionally restricted to one section's body"""
+        return [
+            h for h in self.hits
+            if h.group == group and (section is None
+                                     or section.first_line <= h.line <= section.last_line)
+        ]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Python-Markdown extension for report HTML
+
+ReportExtension makes a single Markdown render produce the template-ready
+HTML described in report_html.py:
+
+- a treeprocessor runs style_tree() on the element tree once inline
+  parsing is done, and strips emoji from raw HTML blocks and marks their
+  citations (mark_raw_html)
+- a postprocessor expands the citation placeholders into spans
+
+Citations are not an inline pattern: with tens of thousands of markers,
+Python-Markdown's per-match handling (and serializing a span element per
+marker) would cost more than the rest of the render.
+
+Usage:
+    md = markdown.Markdown(extensions=['tables', ReportExtension()])
+"""
+
+from markdown.extensions import Extension
+from markdown.postprocessors import Postprocessor
+from markdown.treeprocessors import Treeprocessor
+
+from report_html import expand_citations, mark_raw_html, strip_emoji, style_tree
+
+
+class ReportTreeprocessor(Treeprocessor):
+    # style_tree() options for the next render, and whether it found the summary
+    summary = True
+    summary_to_end = False
+    summary_found = False
+
+    def run(self, root):
+        self.summary_found = style_tree(root, self.summary, self.summary_to_end)
+        stash = self.md.htmlStash
+        stash.rawHtmlBlocks = [mark_raw_html(strip_emoji(block)) if isinstance(block, str) else block
+                               for block in stash.rawHtmlBlocks]
+
+
+class CitationPostprocessor(Postprocessor):
+    def run(self, text):
+        return expand_citations(text)
+
+
+class ReportExtension(Extension):
+    def extendMarkdown(self, md):
+        # After inline parsing (20), before prettify (10)
+        md.treeprocessors.register(ReportTreeprocessor(md), 'report_style', 15)
+        md.postprocessors.register(CitationPostprocessor(md), 'report_citations', 10)
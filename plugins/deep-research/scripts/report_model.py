@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Single-parse report model for md_to_html.py
+
+ReportModel.parse() walks the markdown once, line by line, and records
+everything the HTML conversion reads:
+
+- research type (<!-- TYPE: xxx -->), title (first "# " line)
+- metadata fields: **Generated:**, **Total Sources:**, **Research Mode:**,
+  **Confidence Level:** / 信心等级 / 信心水平
+- "##" section spans with word counts, the bibliography span and the
+  appendix spans
+- the main content markdown (what used to be extract_main_content())
+- bibliography entry lines ([N] ...) and the total word count
+
+Each value means exactly what the separate regex extractors used to find.
+A metadata pattern only runs from the first line containing its label
+literal, so no field costs a pass of its own. Offsets are character
+offsets into the markdown text.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+TYPE_MARKER = re.compile(r"<!--\s*TYPE:\s*(\w+)\s*-->")
+TITLE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+BIB_HEADING = re.compile(r"##\s+(?:Bibliography|参考文献)\s*$")
+BIB_ENTRY = re.compile(r"\[(\d+)\]")
+
+# extract_main_content() rules, applied to stripped lines
+CONTENT_TITLE = re.compile(r"#\s+")
+COMMENT_LINE = re.compile(r"<!--.*-->$")
+METADATA_HEADING = re.compile(r"##\s+(?:Report Metadata|报告元数据)")
+APPENDIX_HEADING = re.compile(r"##\s+(?:Appendix|附录)")
+BIB_HEADING_PREFIX = re.compile(r"##\s+(?:Bibliography|参考文献)")
+
+# field -> (label literals that trigger the pattern, pattern)
+METADATA_FIELDS = {
+    'generated': (("**Generated:**",), re.compile(r"\*\*Generated:\*\*\s*(.+)")),
+    'total_sources': (("**Total Sources:**",), re.compile(r"\*\*Total Sources:\*\*\s*(\d+)")),
+    'research_mode': (("**Research Mode:**",), re.compile(r"\*\*Research Mode:\*\*\s*(.+)")),
+    'confidence': (("信心等级", "Confidence Level", "信心水平"), re.compile(
+        r"\*\*(?:信心等级|Confidence Level|信心水平)\*?\*?[:：]\s*(.+?)(?:\n|$)")),
+}
+
+
+@dataclass
+class ReportSection:
+    title: str
+    start: int  # offset of the "##" heading line
+    end: int  # offset of the next "##" heading line, or the text length
+    words: int = 0  # body words
+
+
+def _is_section_heading(line: str, last: bool) -> bool:
+    """A line matching ^##\\s+ (the heading regex md_to_html always used)"""
+    return line.startswith('##') and (line[2:3].isspace() or (len(line) == 2 and not last))
+
+
+@dataclass
+class ReportModel:
+    text: str
+    research_type: str = "general"
+    title: Optional[str] = None
+    metadata: Dict[str, str] = field(default_factory=dict)
+    sections: List[ReportSection] = field(default_factory=list)
+    bibliography: Optional[ReportSection] = None
+    appendices: List[ReportSection] = field(default_factory=list)
+    content_md: str = ""
+    bibliography_md: str = ""
+    bib_entry_count: int = 0
+    word_count: int = 0
+
+    @property
+    def content_before_bibliography(self) -> str:
+        """Everything before the bibliography heading (all text if there is none)"""
+        return self.text[:self.bibliography.start] if self.bibliography else self.text
+
+    @classmethod
+    def parse(cls, text: str) -> 'ReportModel':
+        model = cls(text)
+        research_type = title = None
+        pending = dict(METADATA_FIELDS)
+        content_lines = []
+        collecting = True  # main content: up to the bibliography or Report Metadata
+        content_title_seen = False
+        current = None
+
+        pos = 0
+        for line in text.split("\n"):
+            words = len(line.split())
+            model.word_count += words
+
+            if research_type is None and '<!--' in line:
+                m = TYPE_MARKER.search(text, pos)
+                research_type = m.group(1).lower() if m else ''
+            if title is None and line.startswith('#'):
+                m = TITLE.match(text, pos)
+                if m:
+                    title = m.group(1).strip()
+            if pending and '**' in line:
+                for name, (labels, pattern) in list(pending.items()):
+                    if any(label in line for label in labels):
+                        m = pattern.search(text, pos)
+                        if m:
+                            model.metadata[name] = m.group(1)
+                        del pending[name]
+            if line.startswith('[') and BIB_ENTRY.match(line):
+                model.bib_entry_count += 1
+
+            if _is_section_heading(line, pos + len(line) == len(text)):
+                if current:
+                    current.end = pos
+                current = ReportSection(line[2:].strip(), pos, len(text))
+                model.sections.append(current)
+                if model.bibliography is None and BIB_HEADING.match(line):
+                    model.bibliography = current
+                    collecting = False
+                if APPENDIX_HEADING.match(line):
+                    model.appendices.append(current)
+            elif current:
+                current.words += words
+
+            if collecting:
+                stripped = line.strip()
+                if not content_title_seen and CONTENT_TITLE.match(stripped):
+                    content_title_seen = True
+                elif COMMENT_LINE.match(stripped):
+                    pass
+                elif METADATA_HEADING.match(stripped):
+                    collecting = False
+                elif not (APPENDIX_HEADING.match(stripped) or BIB_HEADING_PREFIX.match(stripped)):
+                    content_lines.append(line)
+
+            pos += len(line) + 1
+
+        model.research_type = research_type or "general"
+        model.title = title
+        model.content_md = "\n".join(content_lines).strip()
+        if model.bibliography:
+            heading_end = text.find("\n", model.bibliography.start)
+            heading_end = len(text) if heading_end == -1 else heading_end
+            model.bibliography_md = text[heading_end:model.bibliography.end].strip()
+        return model
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Report path expansion shared by the batch modes of md_to_html.py,
+validate_report.py and verify_citations.py
+
+Stdlib only, so importing it stays cheap for every CLI and pool worker.
+"""
+
+import glob
+from pathlib import Path
+from typing import List
+
+
+def expand_report_paths(patterns: List[str]) -> List[Path]:
+    """Resolve directories (their *.md files) and glob patterns to report paths"""
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(path.glob('*.md'))
+        else:
+            matches = sorted(Path(m) for m in glob.glob(pattern, recursive=True))
+        for match in matches:
+            if match.is_file() and match not in seen:
+                seen.add(match)
+                paths.append(match)
+    return paths
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Placeholder and truncation phrase scanner
+
+All phrases the validator looks for (placeholders, content truncation,
+bibliography truncation) are compiled into one Aho-Corasick automaton
+(multi_pattern.py) over lowercased text, so each line is scanned once no
+matter how many phrases there are:
+
+- literal phrases are reported straight from the automaton; case-sensitive
+  ones are confirmed against the original text
+- regex phrases declare a literal anchor; the regex runs only on lines where
+  its anchor occurs, and reports the regex match positions
+
+Pattern file format (JSON; YAML too when PyYAML is installed):
+
+    {"name": "...", "version": 1, "patterns": [
+        {"id": "placeholder-tbd", "group": "placeholder", "literal": "TBD",
+         "case_sensitive": true, "description": "TBD"},
+        {"id": "sections-range", "group": "truncation",
+         "regex": "\\[Sections \\d+-\\d+", "anchor": "[Sections ",
+         "description": "Pattern \"[Sections X-Y\""}
+    ]}
+
+Matching is case-insensitive unless case_sensitive is set. Groups are
+placeholder, truncation (whole report) and bib_truncation (bibliography
+only: scan() skips them on lines outside it, so a loose anchor such as "-"
+does not run its regex all over the report). A later file can override a
+pattern by reusing its id.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from multi_pattern import AhoCorasick
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+DEFAULT_PATTERNS_PATH = Path(__file__).parent / 'report_patterns.json'
+
+GROUPS = ('placeholder', 'truncation', 'bib_truncation')
+
+
+@dataclass
+class PhrasePattern:
+    """A placeholder or truncation phrase"""
+    id: str
+    group: str
+    description: str
+    literal: Optional[str] = None
+    regex: Optional[str] = None
+    anchor: Optional[str] = None
+    case_sensitive: bool = False
+
+    def compile(self) -> 're.Pattern':
+        source = self.regex if self.regex else re.escape(self.literal)
+        return re.compile(source, 0 if self.case_sensitive else re.IGNORECASE)
+
+
+def load_pattern_file(path: Path) -> List[PhrasePattern]:
+    """Parse and validate a JSON/YAML pattern file"""
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix in ('.yaml', '.yml'):
+            if yaml is None:
+                raise ValueError(f"{path}: YAML pattern files require PyYAML (pip install pyyaml)")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    patterns = []
+    for raw in data.get('patterns', []):
+        pattern = PhrasePattern(**raw)
+        if pattern.group not in GROUPS:
+            raise ValueError(f"{path}: pattern {pattern.id}: unknown group '{pattern.group}'")
+        if bool(pattern.literal) == bool(pattern.regex):
+            raise ValueError(f"{path}: pattern {pattern.id}: needs exactly one of literal or regex")
+        if pattern.regex and not pattern.anchor:
+            raise ValueError(f"{path}: pattern {pattern.id}: regex pattern needs a literal anchor")
+        pattern.compile()
+        patterns.append(pattern)
+    return patterns
+
+
+class PhraseScanner:
+    """Compiled phrase set; scan() reports every hit in a line in one pass"""
+
+    def __init__(self, patterns: List[PhrasePattern]):
+        by_id: Dict[str, PhrasePattern] = {}
+        for pattern in patterns:
+            by_id[pattern.id] = pattern
+        self.patterns = list(by_id.values())
+        self._compiled = [p.compile() for p in self.patterns]
+        self._bibliography_only = {i for i, p in enumerate(self.patterns) if p.group == 'bib_truncation'}
+        self._automaton = AhoCorasick(
+            ((p.literal or p.anchor).lower(), i) for i, p in enumerate(self.patterns)
+        )
+        digest = hashlib.sha256(
+            json.dumps([asdict(p) for p in self.patterns], sort_keys=True).encode('utf-8')
+        )
+        self.fingerprint = digest.hexdigest()[:16]
+
+    @classmethod
+    def from_files(cls, extra_paths: Optional[List[Path]] = None) -> 'PhraseScanner':
+        """Default patterns plus any extra files (later files override by id)"""
+        patterns = load_pattern_file(DEFAULT_PATTERNS_PATH)
+        for path in extra_paths or []:
+            patterns.extend(load_pattern_file(path))
+        return cls(patterns)
+
+    def scan(self, line: str, bibliography: bool = True) -> Iterator[Tuple[PhrasePattern, int, int]]:
+        """
+        Yield (pattern, start, end) for every hit in line, in position order.
+        bibliography=False skips bib_truncation patterns.
+        """
+        lowered = line.lower()
+        # Lowercasing can change the length of some non-ASCII text; then
+        # automaton offsets no longer line up and every candidate is re-checked
+        aligned = len(lowered) == len(line)
+
+        hits = []
+        verify = set()
+        for start, end, i in self._automaton.finditer(lowered):
+            if not bibliography and i in self._bibliography_only:
+                continue
+            pattern = self.patterns[i]
+            if pattern.regex or not aligned:
+                verify.add(i)
+            elif not pattern.case_sensitive or line[start:end] == pattern.literal:
+                hits.append((start, end, i))
+        for i in verify:
+            hits.extend((m.start(), m.end(), i) for m in self._compiled[i].finditer(line))
+
+        for start, end, i in sorted(hits):
+            yield self.patterns[i], start, end
+
+
+@lru_cache(maxsize=None)
+def load_scanner(extra_paths: Tuple[str, ...] = ()) -> PhraseScanner:
+    """Shared scanner per pattern-file combination (built once per process)"""
+    return PhraseScanner.from_files([Path(p) for p in extra_paths])
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Pure-stdlib Markdown renderer, used by md_to_html.py when Python-Markdown
+is not installed
+
+Covers the subset research reports use, following Python-Markdown's rules
+(with the tables, fenced_code and sane_lists extensions) where they differ
+from other dialects:
+
+- ATX and setext headings, paragraphs, horizontal rules, blockquotes
+- bullet and numbered lists; a list or table only starts a new block (not
+  in the middle of a paragraph). Unlike Python-Markdown, a list right under
+  an item is nested even when indented by less than 4 spaces
+- pipe tables with column alignment
+- fenced code blocks (``` and ~~~), HTML comments
+- inline code, **strong**, *emphasis*, links, images, <autolinks>, escapes
+  and hard line breaks
+
+Inline HTML and reference-style links are not supported; text is always
+escaped. The element tree gets the same template styling as a
+Python-Markdown render (report_html.style_tree), so both produce the same
+classes and citation spans.
+"""
+
+import re
+import xml.etree.ElementTree as etree
+from typing import List, Tuple
+
+from report_html import expand_citations, style_tree
+
+FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})\s*\{?\.?([\w+-]*)")
+HEADING = re.compile(r"^(#{1,6})(.*?)#*\s*$")
+SETEXT = re.compile(r"^(=+|-+)[ ]*$")
+HR = re.compile(r"^ {0,3}([-*_])(?: *\1){2,} *$")
+LIST_ITEM = re.compile(r"^( *)(?:([-*+])|(\d+)\.)[ \t]+(.*)$")
+TABLE_SEPARATOR = re.compile(r"^ *\|? *:?-+:? *(?:\| *:?-+:? *)*\|? *$")
+QUOTE = re.compile(r"^ {0,3}> ?")
+
+INLINE = re.compile(
+    r"(?P<code>(?P<ticks>`+)(?P<code_text>.+?)(?<!`)(?P=ticks)(?!`))"
+    r"|(?P<escape>\\(?P<escaped>[\\`*_{}\[\]()#+\-.!|>]))"
+    r"|(?P<image>!\[(?P<alt>[^\]]*)\]\((?P<src>[^)\s]*)(?:\s+\"(?P<img_title>[^\"]*)\")?\))"
+    r"|(?P<link>\[(?P<link_text>(?:[^\[\]]|\[[^\[\]]*\])*)\]"
+    r"\((?P<href>[^)\s]*)(?:\s+\"(?P<title>[^\"]*)\")?\))"
+    r"|(?P<autolink><(?P<url>https?://[^>\s]+)>)"
+    r"|(?P<strong>\*\*(?P<strong_text>[^\s*](?:.*?[^\s])?)\*\*"
+    r"|(?<!\w)__(?P<strong_text2>[^\s_](?:.*?[^\s])?)__(?!\w))"
+    r"|(?P<em>\*(?P<em_text>[^\s*](?:.*?[^\s*])?)\*"
+    r"|(?<!\w)_(?P<em_text2>[^\s_](?:.*?[^\s_])?)_(?!\w))"
+    r"|(?P<br> {2,}\n)",
+    re.DOTALL,
+)
+
+# Block elements go on their own lines, as Python-Markdown prints them
+BLOCKS = {"p", "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "li", "pre", "hr",
+          "blockquote", "table", "thead", "tbody", "tr", "th", "td", "div"}
+
+
+def _append_text(parent: etree.Element, text: str):
+    if not text:
+        return
+    if len(parent):
+        parent[-1].tail = (parent[-1].tail or "") + text
+    else:
+        parent.text = (parent.text or "") + text
+
+
+def _inline(parent: etree.Element, text: str):
+    """Parse inline markup in text into parent's text and children"""
+    pos = 0
+    for m in INLINE.finditer(text):
+        _append_text(parent, text[pos:m.start()])
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == "code":
+            etree.SubElement(parent, "code").text = m.group("code_text").strip()
+        elif kind == "escape":
+            _append_text(parent, m.group("escaped"))
+        elif kind == "image":
+            img = etree.SubElement(parent, "img", {"alt": m.group("alt"), "src": m.group("src")})
+            if m.group("img_title"):
+                img.set("title", m.group("img_title"))
+        elif kind == "link":
+            a = etree.SubElement(parent, "a", {"href": m.group("href")})
+            if m.group("title"):
+                a.set("title", m.group("title"))
+            _inline(a, m.group("link_text"))
+        elif kind == "autolink":
+            etree.SubElement(parent, "a", {"href": m.group("url")}).text = m.group("url")
+        elif kind == "strong":
+            _inline(etree.SubElement(parent, "strong"), m.group("strong_text") or m.group("strong_text2"))
+        elif kind == "em":
+            _inline(etree.SubElement(parent, "em"), m.group("em_text") or m.group("em_text2"))
+        elif kind == "br":
+            etree.SubElement(parent, "br").tail = "\n"
+    _append_text(parent, text[pos:])
+
+
+def _split_row(line: str) -> List[str]:
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in re.split(r"(?<!\\)\|", line)]
+
+
+def _table(parent: etree.Element, lines: List[str], i: int) -> int:
+    """Table whose header row is lines[i]; returns the index after it"""
+    header = _split_row(lines[i])
+    aligns = []
+    for cell in _split_row(lines[i + 1]):
+        if cell.startswith(":") and cell.endswith(":"):
+            aligns.append("center")
+        elif cell.startswith(":"):
+            aligns.append("left")
+        elif cell.endswith(":"):
+            aligns.append("right")
+        else:
+            aligns.append(None)
+    aligns = (aligns + [None] * len(header))[:len(header)]
+
+    table = etree.SubElement(parent, "table")
+
+    def row(section: etree.Element, tag: str, cells: List[str]):
+        tr = etree.SubElement(section, "tr")
+        for cell, align in zip(cells + [""] * len(header), aligns):
+            el = etree.SubElement(tr, tag, {"style": f"text-align: {align};"} if align else {})
+            _inline(el, cell)
+
+    row(etree.SubElement(table, "thead"), "th", header)
+    body = etree.SubElement(table, "tbody")
+    i += 2
+    while i < len(lines) and lines[i].strip() and "|" in lines[i]:
+        row(body, "td", _split_row(lines[i]))
+        i += 1
+    return i
+
+
+def _list(parent: etree.Element, lines: List[str], i: int) -> int:
+    """List starting at lines[i]; returns the index after it"""
+    first = LIST_ITEM.match(lines[i])
+    indent = len(first.group(1))
+    ordered = first.group(3) is not None
+    lst = etree.SubElement(parent, "ol" if ordered else "ul")
+    if ordered and first.group(3) != "1":
+        lst.set("start", first.group(3))
+
+    items: List[List[str]] = []
+    loose = False
+    blank = False
+    while i < len(lines):
+        line = lines[i]
+        m = LIST_ITEM.match(line)
+        if not line.strip():
+            blank = True
+        elif m and len(m.group(1)) < indent + 4 and (m.group(3) is not None) == ordered:
+            loose = loose or (blank and bool(items))
+            items.append([m.group(4)])
+            blank = False
+        elif len(line) - len(line.lstrip(" ")) >= indent + 4:
+            if blank:
+                items[-1].append("")
+                loose = True
+            items[-1].append(line[indent + 4:])
+            blank = False
+        elif blank:
+            break  # also where sane_lists starts a list of the other type
+        else:
+            items[-1].append(line.strip())  # lazy continuation
+        i += 1
+
+    for item in items:
+        li = etree.SubElement(lst, "li")
+        _blocks(li, item, in_list=True)
+        if not loose and len(li) and li[0].tag == "p":
+            p = li[0]
+            li.remove(p)
+            li.text = p.text
+            for k, child in enumerate(p):
+                li.insert(k, child)
+    return i
+
+
+def _blocks(parent: etree.Element, lines: List[str], in_list: bool = False):
+    """Parse block structure of lines into parent"""
+    paragraph: List[str] = []
+
+    def flush():
+        if paragraph:
+            _inline(etree.SubElement(parent, "p"), "\n".join(paragraph).strip())
+            paragraph.clear()
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if not stripped:
+            flush()
+            i += 1
+            continue
+
+        fence = FENCE.match(line)
+        if fence:
+            flush()
+            marker = fence.group(1)
+            end = i + 1
+            while end < len(lines) and not (lines[end].strip().startswith(marker)
+                                            and not lines[end].strip().strip(marker[0])):
+                end += 1
+            pre = etree.SubElement(parent, "pre")
+            code = etree.SubElement(pre, "code", {"class": f"language-{fence.group(2)}"}
+                                    if fence.group(2) else {})
+            code.text = "\n".join(lines[i + 1:end]) + "\n"
+            i = end + 1
+            continue
+
+        if stripped.startswith("<!--"):
+            flush()
+            end = i
+            while end < len(lines) and "-->" not in lines[end]:
+                end += 1
+            comment = "\n".join(lines[i:end + 1]).strip()
+            parent.append(etree.Comment(comment[4:-3] if comment.endswith("-->") else comment[4:]))
+            i = end + 1
+            continue
+
+        heading = HEADING.match(line)
+        if heading:
+            flush()
+            _inline(etree.SubElement(parent, f"h{len(heading.group(1))}"), heading.group(2).strip())
+            i += 1
+            continue
+
+        if paragraph and SETEXT.match(line):
+            text = paragraph.pop()
+            flush()
+            _inline(etree.SubElement(parent, "h1" if stripped[0] == "=" else "h2"), text.strip())
+            i += 1
+            continue
+
+        if HR.match(line):
+            flush()
+            etree.SubElement(parent, "hr")
+            i += 1
+            continue
+
+        if QUOTE.match(line):
+            flush()
+            quoted = []
+            while i < len(lines) and QUOTE.match(lines[i]):
+                quoted.append(QUOTE.sub("", lines[i], count=1))
+                i += 1
+            _blocks(etree.SubElement(parent, "blockquote"), quoted)
+            continue
+
+        if not paragraph or in_list:
+            if LIST_ITEM.match(line):
+                flush()
+                i = _list(parent, lines, i)
+                continue
+            if ("|" in line and i + 1 < len(lines) and "-" in lines[i + 1]
+                    and TABLE_SEPARATOR.match(lines[i + 1])):
+                flush()
+                i = _table(parent, lines, i)
+                continue
+
+        paragraph.append(line)
+        i += 1
+    flush()
+
+
+def _layout(el: etree.Element):
+    """Newlines around block children, as in Python-Markdown's output"""
+    blocks = len(el) and el[0].tag in BLOCKS and not (el.text or "").strip()
+    if blocks:
+        el.text = "\n"
+    for child in el:
+        _layout(child)
+        if blocks and not (child.tail or "").strip():
+            child.tail = "\n"
+
+
+def render_section(md_text: str, summary: bool = True, summary_to_end: bool = False) -> Tuple[str, bool]:
+    """
+    Render markdown to template-styled HTML; returns (html, whether the
+    Executive Summary heading was found). summary and summary_to_end are
+    passed to style_tree().
+    """
+    root = etree.Element("div")
+    _blocks(root, md_text.replace("\r\n", "\n").split("\n"))
+    found = style_tree(root, summary, summary_to_end)
+    _layout(root)
+    html = "\n".join(etree.tostring(child, encoding="unicode", method="html").rstrip("\n")
+                     for child in root)
+    return expand_citations(html), found
+
+
+def render(md_text: str) -> str:
+    """Render markdown to template-styled HTML (like convert_md_to_html)"""
+    return render_section(md_text)[0]
@@ -2,81 +2,322 @@
 """
 Report Validation Script
 Ensures research reports meet quality standards before delivery
+
+Usage:
+    python validate_report.py --report report.md
+    python validate_report.py --batch reports/ "archive/**/*.md" --jobs 8
+    python validate_report.py --report report.md --patterns team_phrases.json
+    python validate_report.py --report report.md --watch
+    python validate_report.py --batch reports/ --no-cache
+    python validate_report.py --batch reports/ --format json
+    python validate_report.py --report report.md --coverage --coverage-csv coverage.csv
+
+Batch mode validates reports on a process pool, prints each report's result
+as soon as it finishes, then an aggregated pass/fail table; the exit code is
+non-zero if any report fails. Without --type, each report's research type is
+taken from its <!-- TYPE: xxx --> marker (default: general).
+
+Placeholder and truncation phrases live in report_patterns.json; --patterns
+adds or overrides phrases from further files (see report_patterns.py). All
+phrases are found in the same single pass, and every hit is reported with
+its line and column.
+
+--watch keeps the indexed report in memory and polls the file (stdlib only,
+so no inotify dependency). After each append or edit it re-tokenizes from
+the first changed section and re-runs only the checks whose inputs changed,
+which suits progressive section-by-section assembly.
+
+Verdicts are cached in ~/.claude/research_output/validation_cache.sqlite by
+(content hash, research type, rule-set version), so unchanged reports are
+not re-validated (see validation_cache.py); --no-cache skips the cache.
+
+--format json|sarif prints one JSON object per report (one per line in
+batch mode, in completion order) instead of the text report. Every finding
+carries its check, severity, byte offset, line/column and matched text
+where it has a position; per-check durations are included as well.
+
+--coverage adds per-section citation density, uncited paragraph spans and
+the first-use order of each source (see citation_coverage.py) to the text
+or JSON output; --coverage-csv writes the per-section figures to a CSV.
 """
 
 import argparse
+import contextlib
+import io
+import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from citation_coverage import CitationCoverage, analyze, write_csv
+from report_index import ReportIndex, Heading, Link, Marker, PhraseHit
+from report_patterns import PhraseScanner, load_scanner
+from validation_cache import ValidationCache, content_hash, DEFAULT_VALIDATION_CACHE_PATH
+from report_paths import expand_report_paths
+
+# Bump when check logic changes so cached verdicts (validation_cache.py) are not reused
+RULESET_VERSION = 3
+
+RESEARCH_TYPES = ['general', 'technical', 'comparison', 'market', 'stock', 'exploratory']
+
+# (name, method, index facets it reads); --watch re-runs a check only when
+# one of its facets changed (see ReportIndex.update)
+CHECKS = [
+    ("Executive Summary", '_check_executive_summary', {'sections'}),
+    ("Required Sections", '_check_required_sections', {'sections', 'type'}),
+    ("Citations", '_check_citations', {'markers'}),
+    ("Bibliography", '_check_bibliography', {'bibliography', 'markers', 'bib_truncation'}),
+    ("Placeholder Text", '_check_placeholders', {'placeholder'}),
+    ("Content Truncation", '_check_content_truncation', {'truncation'}),
+    ("Word Count", '_check_word_count', {'words'}),
+    ("Source Count", '_check_source_count', {'bibliography'}),
+    ("Broken Links", '_check_broken_references', {'links'}),
+]
+
+
+def missing_numbers(nums: Iterable[int]) -> List[int]:
+    """
+    Numbers absent from 1..max(nums), in order. Walks the sorted distinct
+    numbers once (O(n log n)) instead of testing each expected number
+    against a list.
+    """
+    missing = []
+    previous = 0
+    for n in sorted(set(nums)):
+        if n > previous + 1:
+            missing.extend(range(previous + 1, n))
+        previous = max(previous, n)
+    return missing
+
+
+def _at(hit: PhraseHit) -> str:
+    return f"line {hit.line}, col {hit.column}"
+
+
+def _rule_id(check_name: str) -> str:
+    """SARIF rule id for a check, e.g. 'Broken Links' -> 'broken-links'"""
+    return check_name.lower().replace(' ', '-')
+
+
+@dataclass
+class Finding:
+    """One error or warning with its position in the report, when it has one"""
+    check: str
+    severity: str  # 'error' or 'warning'
+    message: str
+    offset: Optional[int] = None  # byte offset
+    line: Optional[int] = None
+    column: Optional[int] = None
+    text: Optional[str] = None  # matched text
+
+    @classmethod
+    def at(cls, check: str, severity: str, message: str, token=None) -> 'Finding':
+        """Finding positioned at an index token (Heading, Marker, Link or PhraseHit)"""
+        if token is None:
+            return cls(check, severity, message)
+        if isinstance(token, Heading):
+            text = f"{'#' * token.level} {token.title}"
+        elif isinstance(token, Marker):
+            text = f"[{token.num}]"
+        elif isinstance(token, Link):
+            text = token.target
+        else:
+            text = token.text
+        return cls(check, severity, message, token.offset, token.line,
+                   getattr(token, 'column', 1), text)
 
 
 class ReportValidator:
-    """Validates research report quality"""
+    """
+    Validates research report quality.
+
+    The report is tokenized once into a ReportIndex (report_index.py); each
+    check is a visitor over that index and never rescans the text.
+    """
 
-    def __init__(self, report_path: Path, research_type: str = 'general'):
+    def __init__(self, report_path: Path, research_type: Optional[str] = None,
+                 scanner: Optional[PhraseScanner] = None, keep_data: bool = False,
+                 cache: Optional[ValidationCache] = None):
         self.report_path = report_path
-        self.research_type = research_type
-        self.content = self._read_report()
+        # Placeholder / truncation phrases (report_patterns.json + --patterns files)
+        self.scanner = scanner or load_scanner()
+        self.timings: Dict[str, float] = {}
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self.findings: List[Finding] = []
+        # check name -> (passed, errors, warnings, findings) from its latest run
+        self.results: Dict[str, Tuple[bool, List[str], List[str], List[Finding]]] = {}
+        self._check = ''
+        self._explicit_type = research_type
+        self._coverage: Optional[CitationCoverage] = None
+
+        # An unchanged report reuses its stored verdict without being indexed
+        self.cache = cache
+        self.cached: Optional[Dict] = None
+        if cache:
+            self.cache_key = self._cache_key()
+            self.cached = cache.get(self.cache_key)
+            if self.cached:
+                cache.hits += 1
+            else:
+                cache.misses += 1
+
+        if self.cached:
+            self.index = None
+            self.research_type = self.cached['type']
+        else:
+            self.index = self._read_report(keep_data)
+            # Explicit type wins, then the report's <!-- TYPE: xxx --> marker
+            self.research_type = research_type or self.index.research_type or 'general'
+
+    def _cache_key(self) -> Tuple[str, str, str]:
+        """(content hash, requested type or 'auto', rule-set version)"""
+        started = time.perf_counter()
+        try:
+            digest = content_hash(self.report_path)
+        except Exception as e:
+            print(f"❌ ERROR: Cannot read report: {e}")
+            sys.exit(1)
+        self.timings['Cache lookup'] = time.perf_counter() - started
+        return digest, self._explicit_type or 'auto', f"{RULESET_VERSION}:{self.scanner.fingerprint}"
 
-    def _read_report(self) -> str:
-        """Read report file"""
+    def _read_report(self, keep_data: bool = False) -> ReportIndex:
+        """Read and index report file"""
+        started = time.perf_counter()
         try:
-            with open(self.report_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            index = ReportIndex.build(self.report_path, self.scanner, keep_data=keep_data)
         except Exception as e:
             print(f"❌ ERROR: Cannot read report: {e}")
             sys.exit(1)
+        self.timings['Index'] = time.perf_counter() - started
+        return index
 
-    def validate(self) -> bool:
-        """Run all validation checks"""
+    def validate(self, coverage: bool = False) -> bool:
+        """Run all validation checks; coverage also prints per-section citation coverage"""
         print(f"\n{'='*60}")
         print(f"VALIDATING REPORT: {self.report_path.name}")
         print(f"{'='*60}\n")
 
-        checks = [
-            ("Executive Summary", self._check_executive_summary),
-            ("Required Sections", self._check_required_sections),
-            ("Citations", self._check_citations),
-            ("Bibliography", self._check_bibliography),
-            ("Placeholder Text", self._check_placeholders),
-            ("Content Truncation", self._check_content_truncation),
-            ("Word Count", self._check_word_count),
-            ("Source Count", self._check_source_count),
-            ("Broken Links", self._check_broken_references),
-        ]
+        if self.cached:
+            self._replay_cached()
+        else:
+            self.run_checks()
+            if self.cache:
+                results = {name: (passed, errors, warnings, [asdict(f) for f in findings])
+                           for name, (passed, errors, warnings, findings) in self.results.items()}
+                links = [asdict(l) for l in self.index.links]
+                self.cache.put(self.cache_key, self.research_type, results, links)
+        if coverage:
+            print()
+            self._print_coverage()
+        self._print_summary()
+
+        return len(self.errors) == 0
 
-        for check_name, check_func in checks:
+    def run_checks(self, facets: Optional[Set[str]] = None) -> List[str]:
+        """
+        Run the checks that read any of facets (all checks when None) and
+        rebuild errors/warnings from every check's latest result.
+        Returns the names of the checks that ran.
+        """
+        ran = []
+        for check_name, method, depends in CHECKS:
+            if facets is not None and check_name in self.results and not depends & facets:
+                continue
             print(f"⏳ Checking: {check_name}...", end=" ")
-            passed = check_func()
+            started = time.perf_counter()
+            passed = self._run_check(check_name, method)
+            self.timings[check_name] = time.perf_counter() - started
+            ran.append(check_name)
             if passed:
                 print("✅ PASS")
             else:
                 print("❌ FAIL")
 
-        self._print_summary()
-
-        return len(self.errors) == 0
+        self._collect()
+        return ran
+
+    def _run_check(self, check_name: str, method: str) -> bool:
+        self._check = check_name
+        self.errors, self.warnings, self.findings = [], [], []
+        passed = getattr(self, method)()
+        self.results[check_name] = (passed, self.errors, self.warnings, self.findings)
+        return passed
+
+    def _collect(self):
+        """Rebuild errors/warnings/findings in check order from per-check results"""
+        ordered = [self.results[name] for name, _, _ in CHECKS if name in self.results]
+        self.errors = [e for result in ordered for e in result[1]]
+        self.warnings = [w for result in ordered for w in result[2]]
+        self.findings = [f for result in ordered for f in result[3]]
+
+    def _error(self, message: str, token=None):
+        self.errors.append(message)
+        self._finding('error', message, token)
+
+    def _warning(self, message: str, token=None):
+        self.warnings.append(message)
+        self._finding('warning', message, token)
+
+    def _finding(self, severity: str, message: str, token=None):
+        """Structured finding only (for --format json/sarif)"""
+        self.findings.append(Finding.at(self._check, severity, message, token))
+
+    def _replay_cached(self):
+        """Print the stored per-check verdicts; broken links are re-checked on disk"""
+        for check_name, method, _ in CHECKS:
+            print(f"⏳ Checking: {check_name}...", end=" ")
+            if method == '_check_broken_references':
+                passed = self._run_check(check_name, method)
+                source = 're-checked'
+            else:
+                passed, errors, warnings, findings = self.cached['results'][check_name]
+                self.results[check_name] = (passed, errors, warnings,
+                                            [Finding(**f) for f in findings])
+                source = 'cached'
+            print(f"{'✅ PASS' if passed else '❌ FAIL'} ({source})")
+        self._collect()
+
+    def refresh(self) -> Set[str]:
+        """Re-index the changed part of the report; returns the changed facets"""
+        started = time.perf_counter()
+        facets = self.index.update(self.scanner)
+        self.timings = {'Index': time.perf_counter() - started}
+        self.research_type = self._explicit_type or self.index.research_type or 'general'
+        self._coverage = None
+        return facets
+
+    def coverage(self) -> CitationCoverage:
+        """Per-section citation coverage (citation_coverage.py); indexes the report on a cache hit"""
+        if self._coverage is None:
+            if self.index is None:
+                self.index = self._read_report()
+            started = time.perf_counter()
+            self._coverage = analyze(self.index)
+            self.timings['Coverage'] = time.perf_counter() - started
+        return self._coverage
 
     def _check_executive_summary(self) -> bool:
         """Check executive summary exists and is under 250 words"""
-        pattern = r'##\s+(?:Executive Summary|执行摘要)(.*?)(?=##|\Z)'
-        match = re.search(pattern, self.content, re.DOTALL | re.IGNORECASE)
+        summary = self.index.find_section(['Executive Summary', '执行摘要'])
 
-        if not match:
-            self.errors.append("Missing 'Executive Summary / 执行摘要' section")
+        if not summary:
+            self._error("Missing 'Executive Summary / 执行摘要' section")
             return False
 
-        summary = match.group(1).strip()
-        word_count = len(summary.split())
+        word_count = summary.words
 
         if word_count > 250:
-            self.warnings.append(f"Executive summary too long: {word_count} words (should be ≤250)")
+            self._warning(f"Executive summary too long: {word_count} words (should be ≤250)", summary.heading)
 
         if word_count < 50:
-            self.warnings.append(f"Executive summary too short: {word_count} words (should be ≥50)")
+            self._warning(f"Executive summary too short: {word_count} words (should be ≥50)", summary.heading)
 
         return True
 
@@ -160,197 +401,162 @@ class ReportValidator:
 
         missing = []
         for section in required:
-            # section is "English|Chinese" alternation — build regex
-            alts = '|'.join(re.escape(s) for s in section.split('|'))
-            if not re.search(rf'##.*(?:{alts})', self.content, re.IGNORECASE):
+            # section is "English|Chinese" alternation
+            if not self.index.has_heading(section.split('|')):
                 missing.append(section.split('|')[0])
 
         if missing:
-            self.errors.append(f"Missing sections: {', '.join(missing)}")
+            self._error(f"Missing sections: {', '.join(missing)}")
             return False
 
         # Check recommended sections (warnings only)
         missing_recommended = []
         for section in recommended:
-            alts = '|'.join(re.escape(s) for s in section.split('|'))
-            if not re.search(rf'##.*(?:{alts})', self.content, re.IGNORECASE):
+            if not self.index.has_heading(section.split('|')):
                 missing_recommended.append(section.split('|')[0])
 
         if missing_recommended:
-            self.warnings.append(f"Missing recommended sections (for academic rigor): {', '.join(missing_recommended)}")
+            self._warning(f"Missing recommended sections (for academic rigor): {', '.join(missing_recommended)}")
 
         return True
 
     def _check_citations(self) -> bool:
         """Check citation format and presence"""
         # Find all citation references [1], [2], etc.
-        citations = re.findall(r'\[(\d+)\]', self.content)
+        citations = [m.num for m in self.index.markers]
 
         if not citations:
-            self.errors.append("No citations found in report")
+            self._error("No citations found in report")
             return False
 
         unique_citations = set(citations)
 
         if len(unique_citations) < 10:
-            self.warnings.append(f"Only {len(unique_citations)} unique sources cited (recommended: ≥10)")
+            self._warning(f"Only {len(unique_citations)} unique sources cited (recommended: ≥10)")
 
         # Check for consecutive citation numbers
-        citation_nums = sorted([int(c) for c in unique_citations])
-        if citation_nums:
-            max_citation = max(citation_nums)
-            expected = set(range(1, max_citation + 1))
-            missing = expected - set(citation_nums)
-
-            if missing:
-                self.warnings.append(f"Non-consecutive citation numbers, missing: {sorted(missing)}")
+        missing = missing_numbers(int(c) for c in unique_citations)
+        if missing:
+            self._warning(f"Non-consecutive citation numbers, missing: {missing}")
 
         return True
 
     def _check_bibliography(self) -> bool:
         """Check bibliography exists, matches citations, and has no truncation placeholders"""
-        pattern = r'##\s+(?:Bibliography|参考文献)(.*?)(?=##|\Z)'
-        match = re.search(pattern, self.content, re.DOTALL | re.IGNORECASE)
+        bibliography = self.index.bibliography
 
-        if not match:
-            self.errors.append("Missing 'Bibliography / 参考文献' section")
+        if not bibliography:
+            self._error("Missing 'Bibliography / 参考文献' section")
             return False
 
-        bib_section = match.group(1)
-
         # CRITICAL: Check for truncation placeholders (2025 CiteGuard enhancement)
-        truncation_patterns = [
-            (r'\[\d+-\d+\]', 'Citation range (e.g., [8-75])'),
-            (r'Additional.*citations', 'Phrase "Additional citations"'),
-            (r'would be included', 'Phrase "would be included"'),
-            (r'\[\.\.\.continue', 'Pattern "[...continue"'),
-            (r'\[Continue with', 'Pattern "[Continue with"'),
-            (r'etc\.(?!\w)', 'Standalone "etc."'),
-            (r'and so on', 'Phrase "and so on"'),
-        ]
-
-        for pattern_re, description in truncation_patterns:
-            if re.search(pattern_re, bib_section, re.IGNORECASE):
-                self.errors.append(f"⚠️ CRITICAL: Bibliography contains truncation placeholder: {description}")
-                self.errors.append(f"   This makes the report UNUSABLE - complete bibliography required")
-                return False
+        truncation = self.index.hits_in('bib_truncation', bibliography)
+        if truncation:
+            for hit in truncation:
+                self._error(f"⚠️ CRITICAL: Bibliography contains truncation placeholder: "
+                            f"{hit.description} ({_at(hit)})", hit)
+            self.errors.append(f"   This makes the report UNUSABLE - complete bibliography required")
+            return False
 
         # Count bibliography entries [1], [2], etc.
-        bib_entries = re.findall(r'^\[(\d+)\]', bib_section, re.MULTILINE)
+        bib_entries = self.index.bib_entries
 
         if not bib_entries:
-            self.errors.append("Bibliography has no entries")
+            self._error("Bibliography has no entries", bibliography.heading)
             return False
 
         # Check citation number continuity (no gaps)
-        bib_nums = sorted([int(n) for n in bib_entries])
-        if bib_nums:
-            expected = list(range(1, bib_nums[-1] + 1))
-            actual = bib_nums
-            missing = [n for n in expected if n not in actual]
-            if missing:
-                self.errors.append(f"Bibliography has gaps in numbering: missing {missing}")
-                return False
+        missing = missing_numbers(int(n) for n in bib_entries)
+        if missing:
+            self._error(f"Bibliography has gaps in numbering: missing {missing}", bibliography.heading)
+            return False
 
         # Find citations in text
-        text_citations = set(re.findall(r'\[(\d+)\]', self.content))
+        text_citations = {m.num for m in self.index.markers}
         bib_citations = set(bib_entries)
 
         # Check all citations have bibliography entries
         missing_in_bib = text_citations - bib_citations
         if missing_in_bib:
             self.errors.append(f"Citations missing from bibliography: {sorted(missing_in_bib)}")
+            first_use = {}
+            for marker in self.index.markers:
+                first_use.setdefault(marker.num, marker)
+            for num in sorted(missing_in_bib):
+                self._finding('error', f"Citation [{num}] missing from bibliography", first_use[num])
             return False
 
         # Check for unused bibliography entries
         unused = bib_citations - text_citations
         if unused:
-            self.warnings.append(f"Unused bibliography entries: {sorted(unused)}")
+            self._warning(f"Unused bibliography entries: {sorted(unused)}", bibliography.heading)
 
         return True
 
     def _check_placeholders(self) -> bool:
         """Check for placeholder text that shouldn't be in final report"""
-        placeholders = [
-            'TBD', 'TODO', 'FIXME', 'XXX',
-            '[citation needed]', '[needs citation]',
-            '[placeholder]', '[TODO]', '[TBD]'
-        ]
-
-        found_placeholders = []
-        for placeholder in placeholders:
-            if placeholder in self.content:
-                found_placeholders.append(placeholder)
+        hits = self.index.hits_in('placeholder')
 
-        if found_placeholders:
-            self.errors.append(f"Found placeholder text: {', '.join(found_placeholders)}")
+        if hits:
+            self.errors.append(f"Found placeholder text: {', '.join(f'{h.text} ({_at(h)})' for h in hits)}")
+            for hit in hits:
+                self._finding('error', f"Placeholder text: {hit.text}", hit)
             return False
 
         return True
 
     def _check_content_truncation(self) -> bool:
         """Check for content truncation patterns (2025 Progressive Assembly enhancement)"""
-        truncation_patterns = [
-            (r'Content continues', 'Phrase "Content continues"'),
-            (r'Due to length', 'Phrase "Due to length"'),
-            (r'would continue', 'Phrase "would continue"'),
-            (r'\[Sections \d+-\d+', 'Pattern "[Sections X-Y"'),
-            (r'Additional sections', 'Phrase "Additional sections"'),
-            (r'comprehensive.*word document that continues', 'Pattern "comprehensive...document that continues"'),
-        ]
-
-        for pattern_re, description in truncation_patterns:
-            if re.search(pattern_re, self.content, re.IGNORECASE):
-                self.errors.append(f"⚠️ CRITICAL: Content truncation detected: {description}")
-                self.errors.append(f"   Report is INCOMPLETE and UNUSABLE - regenerate with progressive assembly")
-                return False
+        truncation = self.index.hits_in('truncation')
+        if truncation:
+            for hit in truncation:
+                self._error(f"⚠️ CRITICAL: Content truncation detected: {hit.description} ({_at(hit)})", hit)
+            self.errors.append(f"   Report is INCOMPLETE and UNUSABLE - regenerate with progressive assembly")
+            return False
 
         return True
 
     def _check_word_count(self) -> bool:
         """Check overall report length"""
-        word_count = len(self.content.split())
+        word_count = self.index.word_count
 
         if word_count < 500:
-            self.warnings.append(f"Report is very short: {word_count} words (consider expanding)")
+            self._warning(f"Report is very short: {word_count} words (consider expanding)")
         # No upper limit warning - progressive assembly supports unlimited lengths
 
         return True
 
     def _check_source_count(self) -> bool:
         """Check minimum source count"""
-        pattern = r'##\s+(?:Bibliography|参考文献)(.*?)(?=##|\Z)'
-        match = re.search(pattern, self.content, re.DOTALL | re.IGNORECASE)
-
-        if not match:
+        if not self.index.bibliography:
             return True  # Already caught in bibliography check
 
-        bib_section = match.group(1)
-        bib_entries = re.findall(r'^\[(\d+)\]', bib_section, re.MULTILINE)
+        bib_entries = self.index.bib_entries
 
         source_count = len(set(bib_entries))
 
         if source_count < 10:
-            self.warnings.append(f"Only {source_count} sources (recommended: ≥10)")
+            self._warning(f"Only {source_count} sources (recommended: ≥10)", self.index.bibliography.heading)
 
         return True
 
     def _check_broken_references(self) -> bool:
         """Check for broken internal references"""
         # Find all markdown links [text](./path)
-        internal_links = re.findall(r'\[.*?\]\((\.\/.*?)\)', self.content)
-
+        links = [Link(**l) for l in self.cached['links']] if self.cached else self.index.links
         broken = []
-        for link in internal_links:
+        for link in links:
             # Remove anchor if present
-            link_path = link.split('#')[0]
+            link_path = link.target.split('#')[0]
             full_path = self.report_path.parent / link_path
 
             if not full_path.exists():
                 broken.append(link)
 
         if broken:
-            self.errors.append(f"Broken internal links: {', '.join(broken)}")
+            self.errors.append(f"Broken internal links: {', '.join(l.target for l in broken)}")
+            for link in broken:
+                self._finding('error', f"Broken internal link: {link.target}", link)
             return False
 
         return True
@@ -373,6 +579,17 @@ class ReportValidator:
                 print(f"   • {warning}")
             print()
 
+        timing = ', '.join(f"{name} {secs * 1000:.1f}ms" for name, secs in self.timings.items())
+        print(f"⏱️  TIMING: {timing}\n")
+
+        if self.cache:
+            if self.cached:
+                stamp = time.strftime('%Y-%m-%d %H:%M', time.localtime(self.cached['validated_at']))
+                state = f"hit (content unchanged since {stamp})"
+            else:
+                state = "miss (verdict stored)"
+            print(f"💾 CACHE: {state}\n")
+
         if not self.errors and not self.warnings:
             print("✅ ALL CHECKS PASSED - Report meets quality standards!\n")
         elif not self.errors:
@@ -380,6 +597,254 @@ class ReportValidator:
         else:
             print("❌ VALIDATION FAILED - Please fix errors before delivery\n")
 
+    def _print_coverage(self):
+        """Print per-section citation density and uncited paragraphs"""
+        coverage = self.coverage()
+        print(f"📊 CITATION COVERAGE ({len(coverage.first_use)} sources cited):")
+        print(f"   {'CITES':>5}  {'SOURCES':>7}  {'PER 1K':>6}  {'UNCITED':>9}  SECTION")
+        for s in coverage.sections:
+            indent = '  ' * (s.level - 2)
+            print(f"   {s.citations:>5}  {len(s.sources):>7}  {s.density:>6.1f}  "
+                  f"{len(s.uncited):>4}/{s.paragraphs:<4}  {indent}{s.title}")
+        print()
+
+    def to_json(self, coverage: bool = False) -> Dict:
+        """Result as a JSON-serializable dict (--format json)"""
+        analysis = self.coverage().to_dict() if coverage else None
+        data = {
+            'report': str(self.report_path),
+            'type': self.research_type,
+            'passed': not self.errors,
+            'cache': ('hit' if self.cached else 'miss') if self.cache else None,
+            'checks': [{'name': name, 'passed': self.results[name][0],
+                        'errors': len(self.results[name][1]),
+                        'warnings': len(self.results[name][2]),
+                        'duration_ms': round(self.timings[name] * 1000, 3) if name in self.timings else None}
+                       for name, _, _ in CHECKS if name in self.results],
+            'findings': [asdict(f) for f in self.findings],
+            'timings_ms': {name: round(secs * 1000, 3) for name, secs in self.timings.items()},
+        }
+        if analysis:
+            data['coverage'] = analysis
+        return data
+
+    def to_sarif(self, coverage: bool = False) -> Dict:
+        """Result as a SARIF 2.1.0 log (--format sarif); one rule per check"""
+        uri = self.report_path.as_posix()
+        analysis = self.coverage().to_dict() if coverage else None
+        results = []
+        for f in self.findings:
+            location = {'artifactLocation': {'uri': uri}}
+            if f.line is not None:
+                location['region'] = {
+                    'startLine': f.line, 'startColumn': f.column, 'byteOffset': f.offset,
+                    'byteLength': len(f.text.encode('utf-8')), 'snippet': {'text': f.text},
+                }
+            results.append({
+                'ruleId': _rule_id(f.check),
+                'level': f.severity,
+                'message': {'text': f.message},
+                'locations': [{'physicalLocation': location}],
+            })
+        properties = {
+            'researchType': self.research_type,
+            'cache': ('hit' if self.cached else 'miss') if self.cache else None,
+        }
+        if analysis:
+            properties['citationCoverage'] = analysis
+        properties['durationsMs'] = {name: round(secs * 1000, 3) for name, secs in self.timings.items()}
+        return _sarif_log(uri, {
+            'results': results,
+            'properties': properties,
+        })
+
+    def render(self, fmt: str, coverage: bool = False) -> str:
+        """One-line JSON (json/sarif) for streaming, one object per report"""
+        data = self.to_sarif(coverage) if fmt == 'sarif' else self.to_json(coverage)
+        return json.dumps(data, ensure_ascii=False)
+
+
+def _sarif_log(uri: str, run: Dict) -> Dict:
+    """SARIF 2.1.0 log with one validate_report run over the report at uri"""
+    return {
+        '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {
+                'name': 'validate_report',
+                'version': str(RULESET_VERSION),
+                'rules': [{'id': _rule_id(name), 'name': name} for name, _, _ in CHECKS],
+            }},
+            'artifacts': [{'location': {'uri': uri}}],
+            **run,
+        }],
+    }
+
+
+def watch_report(report_path: Path, research_type: Optional[str] = None,
+                 scanner: Optional[PhraseScanner] = None, interval: float = 0.2,
+                 coverage: bool = False) -> bool:
+    """
+    Validate the report, then poll it for changes until interrupted. On each
+    change only the edited part is re-indexed and only the checks reading
+    a changed facet re-run. Returns whether the last validation passed.
+    """
+    validator = ReportValidator(report_path, research_type=research_type,
+                                scanner=scanner, keep_data=True)
+    validator.validate(coverage)
+    print(f"👀 Watching {report_path} (every {interval:g}s, Ctrl-C to stop)\n")
+
+    def signature():
+        stat = report_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    last = signature()
+    try:
+        while True:
+            time.sleep(interval)
+            try:
+                current = signature()
+                if current == last:
+                    continue
+                last = current
+                facets = validator.refresh()
+            except OSError:
+                continue  # mid-write or briefly missing; retry next tick
+            if not facets:
+                continue
+
+            stamp = time.strftime('%H:%M:%S')
+            print(f"🔄 [{stamp}] {report_path.name} changed ({', '.join(sorted(facets))})")
+            ran = validator.run_checks(facets)
+            elapsed = sum(validator.timings.values()) * 1000
+            print(f"   Re-indexed and re-ran {len(ran)}/{len(CHECKS)} checks in {elapsed:.1f}ms")
+            if coverage:
+                validator._print_coverage()
+            validator._print_summary()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching\n")
+
+    return len(validator.errors) == 0
+
+
+@lru_cache(maxsize=None)
+def _open_cache(path: str) -> ValidationCache:
+    """One cache connection per worker process"""
+    return ValidationCache(Path(path))
+
+
+def _validate_one(report_path: str, research_type: Optional[str],
+                  pattern_files: Tuple[str, ...] = (), cache_path: Optional[str] = None,
+                  fmt: str = 'text', coverage: bool = False) -> Dict:
+    """
+    Validate one report (process-pool worker), capturing its printed output.
+    For json/sarif the output is the report's JSON line instead. With
+    coverage, the per-section CSV rows come back as well.
+    """
+    output = io.StringIO()
+    started = time.perf_counter()
+    rendered = None
+    rows = []
+    with contextlib.redirect_stdout(output):
+        try:
+            validator = ReportValidator(Path(report_path), research_type=research_type,
+                                        scanner=load_scanner(pattern_files),
+                                        cache=_open_cache(cache_path) if cache_path else None)
+            passed = validator.validate(coverage and fmt == 'text')
+            result = {'type': validator.research_type, 'passed': passed,
+                      'errors': len(validator.errors), 'warnings': len(validator.warnings),
+                      'cache': ('hit' if validator.cached else 'miss') if cache_path else '-'}
+            if fmt != 'text':
+                rendered = validator.render(fmt, coverage)
+            if coverage:
+                rows = validator.coverage().csv_rows(report_path)
+        except SystemExit:
+            # Unreadable report; ReportValidator already printed why
+            result = {'type': research_type or '-', 'passed': False, 'errors': 1, 'warnings': 0,
+                      'cache': '-'}
+            error = output.getvalue().strip()
+            if fmt == 'sarif':
+                rendered = json.dumps(_sarif_log(Path(report_path).as_posix(), {
+                    'results': [],
+                    'invocations': [{
+                        'executionSuccessful': False,
+                        'toolExecutionNotifications': [{'level': 'error', 'message': {'text': error}}],
+                    }],
+                }), ensure_ascii=False)
+            elif fmt == 'json':
+                rendered = json.dumps({'report': report_path, 'passed': False, 'error': error},
+                                      ensure_ascii=False)
+    result.update(report=report_path, seconds=time.perf_counter() - started, coverage=rows,
+                  output=output.getvalue() if rendered is None else rendered + '\n')
+    return result
+
+
+def validate_batch(report_paths: List[Path], jobs: Optional[int] = None,
+                   research_type: Optional[str] = None, pattern_files: Tuple[str, ...] = (),
+                   cache_path: Optional[Path] = None, fmt: str = 'text',
+                   coverage: bool = False, coverage_csv: Optional[Path] = None) -> bool:
+    """
+    Validate several reports on a process pool. Each report's output is
+    printed as it completes; the summary table follows input order. With
+    fmt json/sarif only one JSON object per line is printed, per report.
+    coverage_csv collects every report's section coverage in one CSV.
+    Returns True only if every report passes.
+    """
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(report_paths)))
+
+    if fmt == 'text':
+        print(f"\n{'='*60}")
+        print(f"BATCH REPORT VALIDATION: {len(report_paths)} reports ({jobs} jobs)")
+        print(f"{'='*60}")
+
+    results: Dict[str, Dict] = {}
+    started = time.perf_counter()
+    coverage = coverage or coverage_csv is not None
+    args = (research_type, pattern_files, str(cache_path) if cache_path else None, fmt, coverage)
+
+    def report(result: Dict):
+        print(result['output'], end='', flush=True)
+        results[result['report']] = result
+
+    if jobs == 1:
+        for path in report_paths:
+            report(_validate_one(str(path), *args))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_validate_one, str(path), *args) for path in report_paths]
+            for future in as_completed(futures):
+                report(future.result())
+
+    ordered = [results[str(path)] for path in report_paths]
+    passed = sum(1 for r in ordered if r['passed'])
+    if coverage_csv:
+        write_csv(coverage_csv, (row for r in ordered for row in r['coverage']))
+    if fmt != 'text':
+        return passed == len(ordered)
+
+    print(f"\n{'='*60}")
+    print(f"BATCH SUMMARY")
+    print(f"{'='*60}\n")
+    print(f"  {'RESULT':<6}  {'TYPE':<12}  {'ERRORS':>6}  {'WARNINGS':>8}  {'TIME':>8}  {'CACHE':<5}  REPORT")
+    for r in ordered:
+        print(f"  {'PASS' if r['passed'] else 'FAIL':<6}  {r['type']:<12}  {r['errors']:>6}  "
+              f"{r['warnings']:>8}  {r['seconds'] * 1000:>6.0f}ms  {r['cache']:<5}  {r['report']}")
+    print()
+    print(f"{passed}/{len(ordered)} reports passed in {time.perf_counter() - started:.2f}s")
+    if cache_path:
+        hits = sum(1 for r in ordered if r['cache'] == 'hit')
+        print(f"💾 Cache: {hits} hits, {len(ordered) - hits} misses ({cache_path})")
+    if coverage_csv:
+        print(f"📊 Citation coverage written to {coverage_csv}")
+    print()
+
+    if passed == len(ordered):
+        print("✅ ALL REPORTS PASSED\n")
+    else:
+        print(f"❌ {len(ordered) - passed} REPORT(S) FAILED\n")
+
+    return passed == len(ordered)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -389,34 +854,148 @@ def main():
 Examples:
   python validate_report.py --report report.md
   python validate_report.py -r ~/.claude/research_output/research_report_20251104_153045.md
+  python validate_report.py --batch ~/.claude/research_output/ --jobs 8
+  python validate_report.py --batch "reports/**/*.md"
+  python validate_report.py -r report.md --watch
+  python validate_report.py --batch reports/ --format sarif > validation.sarif.jsonl
+  python validate_report.py -r report.md --coverage --coverage-csv coverage.csv
         """
     )
 
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group(required=True)
+
+    target.add_argument(
         '--report', '-r',
         type=str,
-        required=True,
         help='Path to research report markdown file'
     )
 
+    target.add_argument(
+        '--batch', '-b',
+        nargs='+',
+        metavar='PATH_OR_GLOB',
+        help='Directories (*.md inside) or glob patterns of reports to validate'
+    )
+
     parser.add_argument(
         '--type', '-t',
         type=str,
-        choices=['general', 'technical', 'comparison', 'market', 'stock', 'exploratory'],
-        default='general',
-        help='Research type for section validation (default: general)'
+        choices=RESEARCH_TYPES,
+        default=None,
+        help='Research type for section validation (default: general; in --batch mode, '
+             'each report\'s <!-- TYPE: xxx --> marker, else general)'
+    )
+
+    parser.add_argument(
+        '--patterns',
+        action='append',
+        metavar='FILE',
+        help='Extra placeholder/truncation pattern file (JSON/YAML); may be repeated'
+    )
+
+    parser.add_argument(
+        '--watch', '-w',
+        action='store_true',
+        help='Keep running and re-validate incrementally whenever the report changes'
+    )
+
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=0.2,
+        help='Polling interval in seconds for --watch (default: %(default)s)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore and do not update the validation cache'
+    )
+
+    parser.add_argument(
+        '--format', '-f',
+        choices=['text', 'json', 'sarif'],
+        default='text',
+        help='Output format; json/sarif print one JSON object per report '
+             'with positioned findings and per-check durations (default: text)'
+    )
+
+    parser.add_argument(
+        '--coverage',
+        action='store_true',
+        help='Add per-section citation density, uncited paragraphs and first-use order of sources'
+    )
+
+    parser.add_argument(
+        '--coverage-csv',
+        metavar='FILE',
+        help='Write per-section citation coverage to a CSV file (implies --coverage)'
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Reports to validate in parallel in batch mode (default: CPU count)'
     )
 
     args = parser.parse_args()
 
+    pattern_files = tuple(args.patterns or [])
+    try:
+        scanner = load_scanner(pattern_files)
+    except (OSError, ValueError, TypeError, re.error) as e:
+        print(f"❌ ERROR: Cannot load pattern file: {e}")
+        sys.exit(1)
+
+    coverage = args.coverage or args.coverage_csv is not None
+
+    if args.batch and args.watch:
+        print("❌ ERROR: --watch works with a single --report")
+        sys.exit(1)
+
+    if args.watch and args.format != 'text':
+        print("❌ ERROR: --watch only supports --format text")
+        sys.exit(1)
+
+    if args.batch:
+        report_paths = expand_report_paths(args.batch)
+        if not report_paths:
+            print(f"❌ ERROR: No reports matched: {' '.join(args.batch)}")
+            sys.exit(1)
+        passed = validate_batch(report_paths, jobs=args.jobs, research_type=args.type,
+                                pattern_files=pattern_files,
+                                cache_path=None if args.no_cache else DEFAULT_VALIDATION_CACHE_PATH,
+                                fmt=args.format, coverage=coverage,
+                                coverage_csv=Path(args.coverage_csv) if args.coverage_csv else None)
+        sys.exit(0 if passed else 1)
+
     report_path = Path(args.report)
+    # A single report keeps its historical default; only batch mode reads markers
+    research_type = args.type or 'general'
 
     if not report_path.exists():
         print(f"❌ ERROR: Report file not found: {report_path}")
         sys.exit(1)
 
-    validator = ReportValidator(report_path, research_type=args.type)
-    passed = validator.validate()
+    if args.watch:
+        passed = watch_report(report_path, research_type=research_type, scanner=scanner,
+                              interval=args.interval, coverage=coverage)
+        sys.exit(0 if passed else 1)
+
+    cache = None if args.no_cache else ValidationCache()
+    if args.format == 'text':
+        validator = ReportValidator(report_path, research_type=research_type, scanner=scanner, cache=cache)
+        passed = validator.validate(coverage)
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            validator = ReportValidator(report_path, research_type=research_type, scanner=scanner,
+                                        cache=cache)
+            passed = validator.validate()
+        print(validator.render(args.format, coverage))
+
+    if args.coverage_csv:
+        write_csv(Path(args.coverage_csv), validator.coverage().csv_rows(str(report_path)))
 
     sys.exit(0 if passed else 1)
 
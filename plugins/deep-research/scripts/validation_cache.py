@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of report validation verdicts
+
+CI re-validates every report on every commit although most files did not
+change. ValidationCache stores each report's per-check results in a small
+sqlite database keyed by (content hash, requested research type, rule-set
+version), so an unchanged report returns its stored verdict without being
+indexed or checked again.
+
+The rule-set version combines validate_report.RULESET_VERSION (bumped when
+check logic changes) with the fingerprint of the loaded phrase patterns, so
+editing the validator or passing --patterns never reuses stale verdicts.
+Internal link targets are stored too and re-checked on every hit, since
+whether they exist depends on the filesystem, not on the report content.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from bib_stream import MappedReport
+
+DEFAULT_VALIDATION_CACHE_PATH = Path.home() / '.claude' / 'research_output' / 'validation_cache.sqlite'
+
+
+def content_hash(path: Path) -> str:
+    """sha256 of the report bytes"""
+    with MappedReport(path) as report:
+        return hashlib.sha256(report.data).hexdigest()
+
+
+class ValidationCache:
+    """sqlite-backed validation verdicts, safe to share between threads and processes"""
+
+    def __init__(self, path: Path = DEFAULT_VALIDATION_CACHE_PATH):
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Batch workers write from several processes; wait for their locks
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS validation_cache ('
+            ' content_hash TEXT NOT NULL,'
+            ' research_type TEXT NOT NULL,'
+            ' ruleset TEXT NOT NULL,'
+            ' detected_type TEXT NOT NULL,'
+            ' results TEXT NOT NULL,'
+            ' links TEXT NOT NULL,'
+            ' validated_at REAL NOT NULL,'
+            ' PRIMARY KEY (content_hash, research_type, ruleset)) WITHOUT ROWID'
+        )
+        self._conn.commit()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[Dict]:
+        """
+        Return {'type', 'results', 'links', 'validated_at'} for key, or None.
+        results maps check name to [passed, errors, warnings, findings]
+        and links holds the internal links with their positions.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT detected_type, results, links, validated_at FROM validation_cache '
+                'WHERE content_hash = ? AND research_type = ? AND ruleset = ?', key
+            ).fetchone()
+        if not row:
+            return None
+        detected_type, results, links, validated_at = row
+        return {'type': detected_type, 'results': json.loads(results),
+                'links': json.loads(links), 'validated_at': validated_at}
+
+    def put(self, key: Tuple[str, str, str], detected_type: str,
+            results: Dict[str, Tuple[bool, List[str], List[str], List[Dict]]], links: List[Dict]):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO validation_cache '
+                '(content_hash, research_type, ruleset, detected_type, results, links, validated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (*key, detected_type, json.dumps(results, ensure_ascii=False),
+                 json.dumps(links, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -18,6 +18,37 @@ Enhanced in 2025 with:
 Usage:
     python verify_citations.py --report [path]
     python verify_citations.py --report [path] --strict  # Fail on any unverified
+    python verify_citations.py --report [path] --jobs 8  # Verify entries concurrently
+    python verify_citations.py --report [path] --no-cache  # Ignore DOI/URL caches and stored verdicts
+    python verify_citations.py --report [path] --offline-index dois.sqlite  # No network for DOIs
+    python verify_citations.py --report [path] --refresh  # Ignore stored per-entry verdicts
+    python verify_citations.py --report [path] --budget 60  # Stop checking after 60 s
+    python verify_citations.py --batch reports/ --jobs 8 --json-report summary.json
+    python verify_citations.py --report [path] --rules extra_rules.json  # Add rule packs
+
+DOI lookups and URL checks are cached in
+~/.claude/research_output/citation_cache.sqlite (see citation_cache.py), so
+re-cited papers are not fetched again and stale URLs are revalidated with
+conditional requests. For hosts without network access, build a local DOI
+index from a metadata dump with doi_index.py and pass --offline-index.
+
+Verdicts are stored next to the report in <report>.citations.json, keyed by
+a hash of each entry's text; re-runs only verify new or changed entries.
+Stored verdicts are re-checked after --results-ttl days.
+
+With --budget, entries are checked by priority (hallucination-flagged, then
+DOI-bearing, then most-cited in the body) until time runs out; the rest are
+reported as "not checked (budget)".
+
+With --batch, all bibliographies are parsed up front and every unique DOI/URL
+is checked once across all reports; verdicts are fanned back out into
+per-report summaries, and the exit code fails if any report fails.
+
+Near-duplicate entries (same DOI/URL, or similar titles/URLs found with
+MinHash + LSH, see bib_dedupe.py) are listed as merge suggestions.
+
+Hallucination rules live in rule packs (hallucination_rules.json by default,
+see hallucination_rules.py for the format); --rules adds more packs.
 
 Does NOT require API keys - uses free DOI resolver and heuristics.
 """
@@ -25,97 +56,124 @@ Does NOT require API keys - uses free DOI resolver and heuristics.
 import sys
 import argparse
 import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
-from urllib import request, error
+from typing import List, Dict, Iterator, Tuple, Optional
 from urllib.parse import quote
 import json
-import time
+
+from http_pool import HTTPPool, HostHealth, HostUnreachable, BudgetExhausted, DEFAULT_FAILURE_THRESHOLD
+from doi_index import DOIIndex, csl_to_metadata
+from hallucination_rules import RuleEngine
+from bib_dedupe import find_duplicates
+from bib_stream import MappedReport, parse_entries
+from report_paths import expand_report_paths
+from citation_cache import (
+    DOICache, URLCache, ResultsSidecar, entry_hash,
+    DAY, DEFAULT_DOI_TTL, DEFAULT_DOI_NEGATIVE_TTL, DEFAULT_URL_TTL, DEFAULT_RESULTS_TTL,
+    normalize_doi
+)
+
+CITATION_MARKER = re.compile(rb'\[(\d+)\]')
+
+BUDGET_EXHAUSTED = 'Not checked (budget)'
+
+
+class CheckMemo:
+    """Run each DOI/URL check once and share the verdict between reports"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: Dict[Tuple[str, str], Future] = {}
+        self.deduped = 0
+
+    def run(self, key: Tuple[str, str], check, keep=None):
+        """
+        Return check()'s result, computing it only for the first caller of key.
+        If keep(result) is false the result is not shared with later callers.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = self._futures[key] = Future()
+            else:
+                self.deduped += 1
+
+        if owner:
+            try:
+                result = check()
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            if keep and not keep(result):
+                with self._lock:
+                    del self._futures[key]
+            future.set_result(result)
+        return future.result()
+
+    def unique_targets(self) -> Dict[str, int]:
+        with self._lock:
+            counts = Counter(kind for kind, _ in self._futures)
+        return {'doi': counts['doi'], 'url': counts['url']}
+
 
 class CitationVerifier:
     """Verify citations in research report"""
 
-    def __init__(self, report_path: Path, strict_mode: bool = False):
+    def __init__(self, report_path: Path, strict_mode: bool = False, jobs: int = 1,
+                 doi_cache: Optional[DOICache] = None, url_cache: Optional[URLCache] = None,
+                 failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 doi_index: Optional[DOIIndex] = None, refresh: bool = False,
+                 budget: Optional[float] = None, http: Optional[HTTPPool] = None,
+                 memo: Optional[CheckMemo] = None, rule_engine: Optional[RuleEngine] = None,
+                 store_results: bool = True, results_ttl: float = DEFAULT_RESULTS_TTL):
         self.report_path = report_path
         self.strict_mode = strict_mode
-        self.content = self._read_report()
+        self.jobs = max(1, jobs)
+        self.doi_cache = doi_cache
+        self.url_cache = url_cache
+        self.doi_index = doi_index
+        self.refresh = refresh
+        self.budget = budget
+        self.deadline: Optional[float] = None
+        # Hallucination detection rules (2025 CiteGuard), compiled from rule packs
+        self.rule_engine = rule_engine or RuleEngine.from_packs()
+        # Stored verdicts are a cache too: --no-cache neither reads nor writes them
+        self.sidecar = ResultsSidecar(report_path, fingerprint=self.rule_engine.fingerprint,
+                                      ttl=results_ttl) if store_results else None
+        self.http = http or HTTPPool(health=HostHealth(failure_threshold=failure_threshold))
+        self.memo = memo
+        self.summary: Dict = {}
+        self.duplicates = []
+        self._check_readable()
         self.suspicious = []
         self.verified = []
         self.errors = []
 
-        # Hallucination detection patterns (2025 CiteGuard enhancement)
-        self.suspicious_patterns = [
-            # Generic academic-sounding but fake patterns
-            (r'^(A |An |The )?(Study|Analysis|Review|Survey|Investigation) (of|on|into)',
-             "Generic academic title pattern"),
-            (r'^(Recent|Current|Modern|Contemporary) (Advances|Developments|Trends) in',
-             "Generic 'advances' title pattern"),
-            # Too perfect, templated titles
-            (r'^[A-Z][a-z]+ [A-Z][a-z]+: A (Comprehensive|Complete|Systematic) (Review|Analysis|Guide)$',
-             "Too perfect, templated structure"),
-        ]
-
-    def _read_report(self) -> str:
-        """Read report file"""
+    def _check_readable(self):
+        """Fail early if the report cannot be opened (content is memory-mapped on demand)"""
         try:
-            with open(self.report_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            with open(self.report_path, 'rb'):
+                pass
         except Exception as e:
             print(f"L ERROR: Cannot read report: {e}")
             sys.exit(1)
 
+    def iter_bibliography(self) -> Iterator[Dict]:
+        """Lazily yield bibliography entries from the memory-mapped report"""
+        with MappedReport(self.report_path) as report:
+            if not report.bibliography_span():
+                self.errors.append("No Bibliography / 参考文献 section found")
+                return
+            yield from parse_entries(report.iter_bibliography_lines())
+
     def extract_bibliography(self) -> List[Dict]:
         """Extract bibliography entries from report"""
-        pattern = r'##\s+(?:Bibliography|参考文献)(.*?)(?=##|\Z)'
-        match = re.search(pattern, self.content, re.DOTALL | re.IGNORECASE)
-
-        if not match:
-            self.errors.append("No Bibliography / 参考文献 section found")
-            return []
-
-        bib_section = match.group(1)
-
-        # Parse entries: [N] Author (Year). "Title". Venue. URL
-        entries = []
-        lines = bib_section.strip().split('\n')
-
-        current_entry = None
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Check if starts with citation number [N]
-            match_num = re.match(r'^\[(\d+)\]\s+(.+)$', line)
-            if match_num:
-                if current_entry:
-                    entries.append(current_entry)
-
-                num = match_num.group(1)
-                rest = match_num.group(2)
-
-                # Try to parse: Author (Year). "Title". Venue. URL
-                year_match = re.search(r'\((\d{4})\)', rest)
-                title_match = re.search(r'"([^"]+)"', rest)
-                doi_match = re.search(r'doi\.org/(10\.\S+)', rest)
-                url_match = re.search(r'https?://[^\s\)]+', rest)
-
-                current_entry = {
-                    'num': num,
-                    'raw': rest,
-                    'year': year_match.group(1) if year_match else None,
-                    'title': title_match.group(1) if title_match else None,
-                    'doi': doi_match.group(1) if doi_match else None,
-                    'url': url_match.group(0) if url_match else None
-                }
-            elif current_entry:
-                # Multi-line entry, append to raw
-                current_entry['raw'] += ' ' + line
-
-        if current_entry:
-            entries.append(current_entry)
-
-        return entries
+        return list(self.iter_bibliography())
 
     def verify_doi(self, doi: str) -> Tuple[bool, Dict]:
         """
@@ -125,28 +183,49 @@ class CitationVerifier:
         if not doi:
             return False, {}
 
+        if self.memo:
+            return self.memo.run(('doi', normalize_doi(doi)), lambda: self._check_doi(doi),
+                                 keep=lambda result: result[1].get('error') != BUDGET_EXHAUSTED)
+        return self._check_doi(doi)
+
+    def _check_doi(self, doi: str) -> Tuple[bool, Dict]:
+        """Resolve doi via the offline index, the DOI cache or doi.org"""
+        # Offline backend: the local index is authoritative, no network or cache
+        if self.doi_index:
+            metadata = self.doi_index.lookup(doi)
+            if metadata is None:
+                return False, {'error': 'DOI not found in offline index'}
+            return True, metadata
+
+        if self.doi_cache:
+            cached = self.doi_cache.get(doi)
+            if cached:
+                return cached
+
         try:
             # Use content negotiation to get JSON metadata
             url = f"https://doi.org/{quote(doi)}"
-            req = request.Request(url)
-            req.add_header('Accept', 'application/vnd.citationstyles.csl+json')
-
-            with request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
-
-                return True, {
-                    'title': data.get('title', ''),
-                    'year': data.get('issued', {}).get('date-parts', [[None]])[0][0],
-                    'authors': [
-                        f"{a.get('family', '')} {a.get('given', '')}"
-                        for a in data.get('author', [])
-                    ],
-                    'venue': data.get('container-title', '')
-                }
-        except error.HTTPError as e:
-            if e.code == 404:
-                return False, {'error': 'DOI not found (404)'}
-            return False, {'error': f'HTTP {e.code}'}
+            response = self.http.request(
+                'GET', url,
+                headers={'Accept': 'application/vnd.citationstyles.csl+json'},
+                deadline=self.deadline
+            )
+
+            if response.status == 404:
+                not_found = {'error': 'DOI not found (404)'}
+                if self.doi_cache:
+                    self.doi_cache.put(doi, False, not_found)
+                return False, not_found
+            if response.status != 200:
+                return False, {'error': f'HTTP {response.status}'}
+
+            data = json.loads(response.body.decode('utf-8'))
+            metadata = csl_to_metadata(data)
+            if self.doi_cache:
+                self.doi_cache.put(doi, True, metadata)
+            return True, metadata
+        except BudgetExhausted:
+            return False, {'error': BUDGET_EXHAUSTED}
         except Exception as e:
             return False, {'error': str(e)}
 
@@ -158,62 +237,69 @@ class CitationVerifier:
         if not url:
             return False, "No URL"
 
+        if self.memo:
+            # Another report may still have budget left for a check cut short here
+            return self.memo.run(('url', url), lambda: self._check_url(url),
+                                 keep=lambda result: result[1] != BUDGET_EXHAUSTED)
+        return self._check_url(url)
+
+    def _check_url(self, url: str) -> Tuple[bool, str]:
+        """HEAD url (conditionally, if a stale cache entry exists)"""
+        cached = self.url_cache.get(url) if self.url_cache else None
+        if cached and cached['fresh']:
+            return cached['ok'], cached['message']
+
+        # Stale but previously live: ask the server whether it changed
+        headers = {}
+        if cached and cached['ok']:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
         try:
             # HEAD request to check accessibility without downloading
-            req = request.Request(url, method='HEAD')
-            req.add_header('User-Agent', 'Mozilla/5.0 (Research Citation Verifier)')
-
-            with request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    return True, "URL accessible"
-                else:
-                    return False, f"HTTP {response.status}"
-        except error.HTTPError as e:
-            return False, f"HTTP {e.code}"
-        except error.URLError as e:
-            return False, f"URL error: {e.reason}"
+            response = self.http.request('HEAD', url, headers=headers, deadline=self.deadline)
+        except HostUnreachable as e:
+            # Breaker is open: nothing was checked, so don't cache a verdict
+            return False, str(e)
+        except BudgetExhausted:
+            # Cut short by --budget: not a verdict on the URL either
+            return False, BUDGET_EXHAUSTED
+        except OSError as e:
+            message = f"URL error: {e}"
+            response = None
         except Exception as e:
-            return False, f"Connection error: {str(e)[:50]}"
+            message = f"Connection error: {str(e)[:50]}"
+            response = None
+
+        if response is not None:
+            if response.status == 304 and cached:
+                self.url_cache.touch(url)
+                return cached['ok'], cached['message']
+
+            ok = response.status == 200
+            message = "URL accessible" if ok else f"HTTP {response.status}"
+            if self.url_cache:
+                self.url_cache.put(
+                    url, ok, message,
+                    status=response.status,
+                    final_url=response.url,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
+            return ok, message
+
+        if self.url_cache:
+            self.url_cache.put(url, False, message)
+        return False, message
 
     def detect_hallucination_patterns(self, entry: Dict) -> List[str]:
         """
         Detect common LLM hallucination patterns in citations (2025 CiteGuard).
         Returns list of detected issues.
         """
-        issues = []
-        title = entry.get('title', '')
-
-        if not title:
-            return issues
-
-        # Check against suspicious patterns
-        for pattern, description in self.suspicious_patterns:
-            if re.match(pattern, title, re.IGNORECASE):
-                issues.append(f"Suspicious title pattern: {description}")
-
-        # Check for overly generic titles
-        generic_words = ['overview', 'introduction', 'guide', 'handbook', 'manual']
-        if any(word in title.lower() for word in generic_words) and len(title.split()) < 5:
-            issues.append("Very generic short title")
-
-        # Check for placeholder-like titles
-        if any(x in title.lower() for x in ['tbd', 'todo', 'placeholder', 'example']):
-            issues.append("Placeholder text in title")
-
-        # Check for inconsistent metadata
-        if entry.get('year'):
-            year = int(entry['year'])
-            # Very recent without DOI or URL is suspicious
-            if year >= 2024 and not entry.get('doi') and not entry.get('url'):
-                issues.append("Recent year (2024+) with no verification method")
-            # Future year is definitely wrong
-            if year > 2025:
-                issues.append(f"Future year: {year}")
-            # Very old with modern phrasing is suspicious
-            if year < 2000 and any(word in title.lower() for word in ['ai', 'llm', 'gpt', 'transformer']):
-                issues.append(f"Anachronistic: pre-2000 ({year}) citation mentioning modern AI terms")
-
-        return issues
+        return [message for _, message in self.rule_engine.scan(entry)]
 
     def check_title_similarity(self, title1: str, title2: str) -> float:
         """
@@ -241,30 +327,37 @@ class CitationVerifier:
         return overlap / total if total > 0 else 0.0
 
     def verify_entry(self, entry: Dict) -> Dict:
-        """Verify a single bibliography entry (Enhanced 2025 with CiteGuard)"""
+        """
+        Verify a single bibliography entry (Enhanced 2025 with CiteGuard).
+        Progress lines are collected in result['log'] rather than printed, so
+        concurrent runs can still report in bibliography order.
+        """
         result = {
             'num': entry['num'],
             'status': 'unknown',
             'issues': [],
             'metadata': {},
-            'verification_methods': []
+            'verification_methods': [],
+            'log': []
         }
+        log = result['log']
 
         # STEP 1: Run hallucination detection (CiteGuard 2025)
-        hallucination_issues = self.detect_hallucination_patterns(entry)
-        if hallucination_issues:
-            result['issues'].extend(hallucination_issues)
+        rule_hits = self.rule_engine.scan(entry)
+        if rule_hits:
+            result['rule_ids'] = [rule_id for rule_id, _ in rule_hits]
+            result['issues'].extend(message for _, message in rule_hits)
             result['status'] = 'suspicious'
 
         # STEP 2: Has DOI?
         if entry['doi']:
-            print(f"  [{entry['num']}] Checking DOI {entry['doi']}...", end=' ')
+            line = f"  [{entry['num']}] Checking DOI {entry['doi']}..."
             success, metadata = self.verify_doi(entry['doi'])
 
             if success:
                 result['metadata'] = metadata
                 result['status'] = 'verified'
-                print("")
+                log.append(f"{line} ")
 
                 # Check title similarity if we have both
                 if entry['title'] and metadata.get('title'):
@@ -288,7 +381,7 @@ class CitationVerifier:
                         result['status'] = 'suspicious'
 
             else:
-                print(f"✗ {metadata.get('error', 'Failed')}")
+                log.append(f"{line} ✗ {metadata.get('error', 'Failed')}")
                 result['status'] = 'unverified'
                 result['issues'].append(f"DOI resolution failed: {metadata.get('error', 'unknown')}")
 
@@ -300,7 +393,7 @@ class CitationVerifier:
                 # Upgrade status if URL verifies
                 if result['status'] in ['unknown', 'no_doi', 'unverified']:
                     result['status'] = 'url_verified'
-                print(f"  [{entry['num']}] URL accessible ✓")
+                log.append(f"  [{entry['num']}] URL accessible ✓")
             else:
                 result['issues'].append(f"URL check failed: {url_status}")
 
@@ -312,29 +405,174 @@ class CitationVerifier:
 
         return result
 
-    def verify_all(self):
-        """Verify all bibliography entries"""
+    def _budget_priority(self, entries: List[Dict]) -> List[int]:
+        """
+        Entry positions in checking order for --budget: hallucination-flagged
+        first, then DOI-bearing, then most-cited in the body text.
+        """
+        with MappedReport(self.report_path) as report:
+            span = report.bibliography_span()
+            body_end = span[0] if span else len(report.data)
+            cite_counts = Counter(
+                m.group(1).decode() for m in CITATION_MARKER.finditer(report.data, 0, body_end)
+            )
+
+        def priority(i):
+            entry = entries[i]
+            flagged = bool(self.detect_hallucination_patterns(entry))
+            return (not flagged, not entry['doi'], -cite_counts[entry['num']], i)
+
+        return sorted(range(len(entries)), key=priority)
+
+    def _verify_within_budget(self, entry: Dict) -> Dict:
+        """verify_entry, or a 'not_checked' result once the deadline has passed"""
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return {
+                'num': entry['num'],
+                'status': 'not_checked',
+                'issues': [BUDGET_EXHAUSTED],
+                'metadata': {},
+                'verification_methods': [],
+                'log': []
+            }
+
+        result = self.verify_entry(entry)
+
+        # A DOI/URL check cut short by the deadline says nothing about the
+        # citation; checks that finished keep their verdict
+        if (result['status'] in ('unverified', 'unknown')
+                and any(issue.endswith(BUDGET_EXHAUSTED) for issue in result['issues'])):
+            result['status'] = 'not_checked'
+        return result
+
+    def _pending_order(self, entries: List[Dict], reused: Dict[int, Dict]) -> List[int]:
+        """Positions still to verify, in checking order (starts the budget clock)"""
+        order = list(range(len(entries)))
+        if self.budget is not None:
+            self.deadline = time.monotonic() + self.budget
+            order = self._budget_priority(entries)
+        return [i for i in order if i not in reused]
+
+    def submit_entries(self, entries: List[Dict], reused: Dict[int, Dict],
+                       pool: ThreadPoolExecutor) -> List:
+        """Queue pending entries on pool; returns results/futures in bibliography order"""
+        futures = {
+            i: pool.submit(self._verify_within_budget, entries[i])
+            for i in self._pending_order(entries, reused)
+        }
+        return [reused[i] if i in reused else futures[i] for i in range(len(entries))]
+
+    def _run_entries(self, entries: List[Dict], reused: Optional[Dict[int, Dict]] = None):
+        """
+        Yield verify_entry results in bibliography order.
+        reused maps entry positions to stored results that skip verification.
+        With jobs > 1 entries are checked on a thread pool; rate limiting is
+        per host, so total time follows the slowest host rather than the sum.
+        With a budget, entries are started in priority order instead.
+        """
+        reused = reused or {}
+
+        if self.jobs == 1:
+            pending = self._pending_order(entries, reused)
+            results = dict(reused)
+            if self.budget is None:
+                # Stream results as they are verified
+                for i in range(len(entries)):
+                    if i not in results:
+                        results[i] = self._verify_within_budget(entries[i])
+                    yield results[i]
+                return
+            for i in pending:
+                results[i] = self._verify_within_budget(entries[i])
+            for i in range(len(entries)):
+                yield results[i]
+            return
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            for slot in self.submit_entries(entries, reused, pool):
+                yield slot.result() if isinstance(slot, Future) else slot
+
+    def _reuse_stored_results(self, entries: List[Dict]) -> Dict[int, Dict]:
+        """Map entry positions to stored verdicts whose entry text is unchanged"""
+        if self.refresh or self.sidecar is None:
+            return {}
+        stored = self.sidecar.load()
+        reused = {}
+        for i, entry in enumerate(entries):
+            result = stored.get(entry_hash(entry))
+            if result:
+                result = dict(result, num=entry['num'])
+                result['log'] = [f"  [{entry['num']}] Unchanged, reusing stored verdict: {result['status']}"]
+                reused[i] = result
+        return reused
+
+    def _print_connection_stats(self):
+        """Print per-host keep-alive reuse so pooling gains are visible"""
+        stats = self.http.stats()
+        if not stats:
+            return
+        print('Connections per host (requests / opened / reused):')
+        for host, s in sorted(stats.items(), key=lambda kv: -kv[1].requests):
+            print(f'  {host}: {s.requests} / {s.opened} / {s.reused}')
+
+        open_hosts = self.http.health.open_hosts()
+        if open_hosts:
+            print('Unreachable hosts (circuit breaker open):')
+            for host, skipped in sorted(open_hosts.items()):
+                print(f'  {host}: {skipped} checks skipped')
+
+    def _print_header(self):
         print(f"\n{'='*60}")
         print(f"CITATION VERIFICATION: {self.report_path.name}")
         print(f"{'='*60}\n")
 
+    def _print_found(self, entries: List[Dict], reused: Dict[int, Dict]):
+        print(f"Found {len(entries)} citations\n")
+        if reused:
+            print(f"Reusing {len(reused)} stored verdicts, verifying {len(entries) - len(reused)}\n")
+
+    def verify_all(self):
+        """Verify all bibliography entries"""
+        self._print_header()
+
         entries = self.extract_bibliography()
 
         if not entries:
             print("L No bibliography entries found\n")
             return False
 
-        print(f"Found {len(entries)} citations\n")
+        self.duplicates = find_duplicates(entries)
+        reused = self._reuse_stored_results(entries)
+        self._print_found(entries, reused)
 
         results = []
-        for entry in entries:
-            result = self.verify_entry(entry)
+        for result in self._run_entries(entries, reused):
+            for line in result['log']:
+                print(line)
             results.append(result)
 
-            # Rate limiting
-            time.sleep(0.5)
+        if self.sidecar:
+            self.sidecar.save(entries, results)
+        return self.summarize(results)
+
+    def summarize(self, results: List[Dict], network_stats: bool = True) -> bool:
+        """Print the verification summary and return the pass/fail decision"""
+        passed = self._print_summary(results, network_stats)
+        self.summary = self._summary(passed, results)
+        return passed
+
+    def _summary(self, passed: bool, results: List[Dict]) -> Dict:
+        """Per-report summary, as written to the --json-report aggregate"""
+        return {
+            'report': str(self.report_path),
+            'passed': passed,
+            'total': len(results),
+            'counts': dict(Counter(r['status'] for r in results)),
+            'results': [{k: v for k, v in r.items() if k != 'log'} for r in results],
+            'duplicates': [{'nums': c.nums, 'reasons': c.reasons} for c in self.duplicates],
+        }
 
-        # Summarize
+    def _print_summary(self, results: List[Dict], network_stats: bool) -> bool:
         print(f"\n{'='*60}")
         print(f"VERIFICATION SUMMARY")
         print(f"{'='*60}\n")
@@ -343,11 +581,24 @@ class CitationVerifier:
         url_verified = [r for r in results if r['status'] == 'url_verified']
         suspicious = [r for r in results if r['status'] == 'suspicious']
         unverified = [r for r in results if r['status'] in ['unverified', 'no_doi', 'unknown']]
+        not_checked = [r for r in results if r['status'] == 'not_checked']
+        checked_count = len(results) - len(not_checked)
 
         print(f'DOI Verified: {len(verified)}/{len(results)}')
         print(f'URL Verified: {len(url_verified)}/{len(results)}')
         print(f'Suspicious: {len(suspicious)}/{len(results)}')
         print(f'Unverified: {len(unverified)}/{len(results)}')
+        if self.budget is not None:
+            print(f'Not checked (budget {self.budget:g}s): {len(not_checked)}/{len(results)} '
+                  f'(coverage {checked_count / len(results):.0%})')
+        if self.doi_cache:
+            print(f'DOI cache: {self.doi_cache.hits} hits, {self.doi_cache.misses} misses')
+        if self.url_cache:
+            print(f'URL cache: {self.url_cache.hits} hits, '
+                  f'{self.url_cache.revalidated} revalidated (304), '
+                  f'{self.url_cache.misses} misses')
+        if network_stats:
+            self._print_connection_stats()
         print()
 
         if suspicious:
@@ -364,6 +615,17 @@ class CitationVerifier:
                 print(f"  [{r['num']}] {r['issues'][0] if r['issues'] else 'Unknown'}")
             print()
 
+        if self.duplicates:
+            print('POSSIBLE DUPLICATES (merge suggestions):')
+            for cluster in self.duplicates:
+                print(f"  {cluster.suggestion()}")
+            print()
+
+        if not_checked:
+            print('NOT CHECKED (time budget exhausted):')
+            print(f"  {', '.join('[' + r['num'] + ']' for r in not_checked)}")
+            print()
+
         # Decision (Enhanced 2025 - includes URL-verified as acceptable)
         total_verified = len(verified) + len(url_verified)
 
@@ -379,7 +641,18 @@ class CitationVerifier:
             print('STRICT MODE: Unverified citations found')
             return False
 
-        if total_verified / len(results) < 0.5:
+        if not_checked:
+            if self.strict_mode:
+                print(f'STRICT MODE: {len(not_checked)} citations not checked within budget')
+                return False
+            print(f'WARNING: Partial coverage - {len(not_checked)} citations not checked within budget')
+
+        if checked_count == 0:
+            print('WARNING: No citations checked within budget')
+            return True  # Pass with warning
+
+        # Ratio over checked entries; partial coverage is reported above
+        if total_verified / checked_count < 0.5:
             print('WARNING: Less than 50% citations verified')
             return True  # Pass with warning
         else:
@@ -387,6 +660,88 @@ class CitationVerifier:
             return True
 
 
+def verify_batch(report_paths: List[Path], jobs: int = 1, json_report: Optional[Path] = None,
+                 failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, **verifier_kwargs) -> bool:
+    """
+    Verify several reports, checking each unique DOI/URL only once.
+    All bibliographies are parsed and queued on one thread pool before any
+    output, then verdicts are printed per report in the given order.
+    Returns True only if every report passes.
+    """
+    memo = CheckMemo()
+    http = HTTPPool(health=HostHealth(failure_threshold=failure_threshold))
+    verifiers = [
+        CitationVerifier(path, jobs=jobs, http=http, memo=memo, **verifier_kwargs)
+        for path in report_paths
+    ]
+
+    print(f"\n{'='*60}")
+    print(f"BATCH CITATION VERIFICATION: {len(verifiers)} reports")
+    print(f"{'='*60}")
+
+    summaries = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        scheduled = []
+        for verifier in verifiers:
+            entries = verifier.extract_bibliography()
+            reused = verifier._reuse_stored_results(entries) if entries else {}
+            slots = verifier.submit_entries(entries, reused, pool) if entries else []
+            scheduled.append((verifier, entries, reused, slots))
+
+        for verifier, entries, reused, slots in scheduled:
+            verifier._print_header()
+            if not entries:
+                print("L No bibliography entries found\n")
+                verifier.summary = verifier._summary(False, [])
+                summaries.append(verifier.summary)
+                continue
+
+            verifier.duplicates = find_duplicates(entries)
+            verifier._print_found(entries, reused)
+            results = []
+            for slot in slots:
+                result = slot.result() if isinstance(slot, Future) else slot
+                for line in result['log']:
+                    print(line)
+                results.append(result)
+
+            if verifier.sidecar:
+                verifier.sidecar.save(entries, results)
+            verifier.summarize(results, network_stats=False)
+            summaries.append(verifier.summary)
+
+    all_passed = all(s['passed'] for s in summaries)
+    targets = memo.unique_targets()
+
+    print(f"\n{'='*60}")
+    print(f"BATCH SUMMARY")
+    print(f"{'='*60}\n")
+    for s in summaries:
+        counts = ', '.join(f"{k}={v}" for k, v in sorted(s['counts'].items()))
+        print(f"  {'PASS' if s['passed'] else 'FAIL'}  {s['report']}  ({s['total']} citations: {counts})")
+    print()
+    print(f"Unique targets checked: {targets['doi']} DOIs, {targets['url']} URLs "
+          f"({memo.deduped} duplicate checks avoided)")
+    if verifiers:
+        verifiers[0]._print_connection_stats()
+    print(f"\n{'BATCH PASSED' if all_passed else 'BATCH FAILED'}: "
+          f"{sum(s['passed'] for s in summaries)}/{len(summaries)} reports passed")
+
+    if json_report:
+        aggregate = {
+            'passed': all_passed,
+            'reports': summaries,
+            'unique_targets': targets,
+            'deduped_checks': memo.deduped,
+            'connections': {host: vars(stats) for host, stats in http.stats().items()},
+        }
+        with open(json_report, 'w', encoding='utf-8') as f:
+            json.dump(aggregate, f, ensure_ascii=False, indent=2)
+        print(f"Aggregate report: {json_report}")
+
+    return all_passed
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Verify citations in research report",
@@ -394,33 +749,163 @@ def main():
         epilog="""
 Examples:
   python verify_citations.py --report report.md
+  python verify_citations.py --report report.md --jobs 8
+  python verify_citations.py --batch ~/.claude/research_output/ --jobs 8
+  python verify_citations.py --batch "reports/**/*.md" --json-report summary.json
 
 Note: Requires internet connection to check DOIs.
 Uses free DOI resolver - no API key needed.
         """
     )
 
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group(required=True)
+
+    target.add_argument(
         '--report', '-r',
         type=str,
-        required=True,
         help='Path to research report markdown file'
     )
 
+    target.add_argument(
+        '--batch', '-b',
+        nargs='+',
+        metavar='PATH_OR_GLOB',
+        help='Directories (*.md inside) or glob patterns of reports to verify together'
+    )
+
+    parser.add_argument(
+        '--json-report',
+        type=str,
+        help='Write an aggregate JSON report (requires --batch)'
+    )
+
     parser.add_argument(
         '--strict',
         action='store_true',
         help='Strict mode: fail on any unverified or suspicious citations'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of entries to verify concurrently (default: 1)'
+    )
+
+    parser.add_argument(
+        '--rules',
+        action='append',
+        metavar='PACK',
+        help='Extra hallucination rule pack (JSON/YAML); may be repeated'
+    )
+
+    parser.add_argument(
+        '--breaker-threshold',
+        type=int,
+        default=DEFAULT_FAILURE_THRESHOLD,
+        help='Consecutive network failures before a host is marked unreachable '
+             '(default: %(default)s)'
+    )
+
+    parser.add_argument(
+        '--offline-index',
+        type=str,
+        help='Verify DOIs against a local index built with doi_index.py (no network)'
+    )
+
+    parser.add_argument(
+        '--budget',
+        type=float,
+        help='Time budget in seconds; unchecked entries are reported as "not checked (budget)"'
+    )
+
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Re-verify every entry instead of reusing stored verdicts'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the persistent DOI/URL caches or stored verdicts'
+    )
+
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=DEFAULT_DOI_TTL / DAY,
+        help='Days before cached DOI metadata is refetched (default: %(default)g)'
+    )
+
+    parser.add_argument(
+        '--url-cache-ttl',
+        type=float,
+        default=DEFAULT_URL_TTL / DAY,
+        help='Days before a live URL is revalidated (default: %(default)g)'
+    )
+
+    parser.add_argument(
+        '--results-ttl',
+        type=float,
+        default=DEFAULT_RESULTS_TTL / DAY,
+        help='Days before a stored per-entry verdict is re-verified (default: %(default)g)'
+    )
+
+    parser.add_argument(
+        '--cache-404-ttl',
+        type=float,
+        default=DEFAULT_DOI_NEGATIVE_TTL / DAY,
+        help='Days before a cached "DOI not found" is retried (default: %(default)g)'
+    )
+
     args = parser.parse_args()
-    report_path = Path(args.report)
 
-    if not report_path.exists():
-        print(f"ERROR: Report file not found: {report_path}")
+    if args.json_report and not args.batch:
+        parser.error('--json-report requires --batch')
+
+    if args.batch:
+        report_paths = expand_report_paths(args.batch)
+        if not report_paths:
+            print(f"ERROR: No reports matched: {' '.join(args.batch)}")
+            sys.exit(1)
+    else:
+        report_path = Path(args.report)
+        if not report_path.exists():
+            print(f"ERROR: Report file not found: {report_path}")
+            sys.exit(1)
+
+    try:
+        rule_engine = RuleEngine.from_packs([Path(p) for p in args.rules or []])
+    except (OSError, ValueError, TypeError, re.error) as e:
+        print(f"ERROR: Cannot load rule pack: {e}")
         sys.exit(1)
 
-    verifier = CitationVerifier(report_path, strict_mode=args.strict)
+    doi_index = None
+    if args.offline_index:
+        index_path = Path(args.offline_index)
+        if not index_path.exists():
+            print(f"ERROR: Offline DOI index not found: {index_path}")
+            sys.exit(1)
+        doi_index = DOIIndex(index_path)
+
+    doi_cache = url_cache = None
+    if not args.no_cache:
+        doi_cache = DOICache(ttl=args.cache_ttl * DAY, negative_ttl=args.cache_404_ttl * DAY)
+        url_cache = URLCache(ttl=args.url_cache_ttl * DAY)
+
+    verifier_kwargs = dict(strict_mode=args.strict, doi_cache=doi_cache, url_cache=url_cache,
+                           failure_threshold=args.breaker_threshold, doi_index=doi_index,
+                           refresh=args.refresh, budget=args.budget,
+                           rule_engine=rule_engine, store_results=not args.no_cache,
+                           results_ttl=args.results_ttl * DAY)
+
+    if args.batch:
+        passed = verify_batch(report_paths, jobs=args.jobs, json_report=args.json_report,
+                              **verifier_kwargs)
+        sys.exit(0 if passed else 1)
+
+    verifier = CitationVerifier(report_path, jobs=args.jobs, **verifier_kwargs)
     passed = verifier.verify_all()
 
     sys.exit(0 if passed else 1)
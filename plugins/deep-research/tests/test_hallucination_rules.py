@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from hallucination_rules import RuleEngine, load_rule_pack
+
+
+def _write_pack(path, *patterns):
+    rules = [{'id': f'rule-{n}', 'match': 'regex', 'pattern': pattern, 'message': 'm'}
+             for n, pattern in enumerate(patterns)]
+    path.write_text(json.dumps({'name': 'test', 'version': 1, 'rules': rules}), encoding='utf-8')
+    return path
+
+
+@pytest.mark.parametrize('pattern', [r'(\w+) \1', r'(A )?(?(1)Study|Review)'])
+def test_numbered_backreference_rejected(tmp_path, pattern):
+    pack = _write_pack(tmp_path / 'pack.json', pattern)
+    with pytest.raises(ValueError, match='rule-0'):
+        load_rule_pack(pack)
+
+
+def test_duplicate_group_name_rejected(tmp_path):
+    pack = _write_pack(tmp_path / 'pack.json', r'(?P<word>\w+) of', r'(?P<word>\w+) on')
+    with pytest.raises(ValueError, match="rule-1: group name 'word' is already used by rule rule-0"):
+        RuleEngine.from_packs([pack])
+
+
+def test_reserved_group_name_rejected(tmp_path):
+    pack = _write_pack(tmp_path / 'pack.json', r'(?P<r0>\w+) of')
+    with pytest.raises(ValueError, match='reserved'):
+        RuleEngine.from_packs([pack])
+
+
+def test_groups_and_named_backreference_allowed(tmp_path):
+    pack = _write_pack(tmp_path / 'pack.json', r'(?P<word>\w+) (?P=word)\b', r'[\1-\7]x (Study)')
+    engine = RuleEngine.from_packs([pack])
+    assert ('rule-0', 'm') in engine.scan({'title': 'Data data analysis'})
+    assert ('rule-0', 'm') not in engine.scan({'title': 'Data analysis'})
@@ -0,0 +1,32 @@
+import socket
+
+from http_pool import HTTPPool, HostHealth
+from verify_citations import CitationVerifier
+
+
+def _dead_port() -> int:
+    """A local port nothing listens on, so connections are refused"""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def test_breaker_caps_connections_to_dead_host(tmp_path):
+    threshold = 3
+    port = _dead_port()
+    bibliography = '\n\n'.join(
+        f'[{n}] Author (2024). "Measured study number {n} of pooled clients". '
+        f'Example. http://127.0.0.1:{port}/page/{n}'
+        for n in range(1, 11)
+    )
+    report = tmp_path / 'report.md'
+    report.write_text(f'# Report\n\nClaim [1].\n\n## Bibliography\n\n{bibliography}\n',
+                      encoding='utf-8')
+
+    http = HTTPPool(health=HostHealth(failure_threshold=threshold))
+    verifier = CitationVerifier(report, jobs=8, http=http, store_results=False)
+    verifier.verify_all()
+
+    stats = http.stats()[f'127.0.0.1:{port}']
+    assert stats.opened <= threshold
+    assert http.health.open_hosts()[f'127.0.0.1:{port}'] >= 10 - threshold